@@ -0,0 +1,123 @@
+"""
+Checkpoint/resume support for long file runs.
+
+A checkpoint directory holds one pickled DataFrame part per processed chunk
+plus a manifest recording which row ranges are done:
+
+  <output>.checkpoint/
+    manifest.json      : run key, rows done, parts [{file, start, end, stats}]
+    part-00001.pkl     : results for rows [start, end)
+    ...
+
+Parts are written before the manifest is updated, and the manifest is replaced
+atomically, so a run killed at any point resumes from the last complete chunk.
+"""
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+MANIFEST_NAME = "manifest.json"
+
+
+def _atomic_write_json(path: str, data: dict) -> None:
+    """Write JSON to a temp file and rename it over `path`."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+class RunCheckpoint:
+    """Processed row ranges and partial outputs for one process_file run."""
+
+    def __init__(self, directory: str, run_key: str):
+        self.directory = directory
+        self.run_key = run_key
+        self.parts: List[Dict] = []
+        self._manifest_path = os.path.join(directory, MANIFEST_NAME)
+
+    @staticmethod
+    def make_run_key(input_file: str, text_columns: Sequence[str], settings: Dict) -> str:
+        """
+        Fingerprint the input file and every setting that affects the output.
+
+        A checkpoint is only resumed if its run key matches, so changing the
+        input file, columns or extraction settings starts a fresh run.
+        """
+        stat = os.stat(input_file)
+        payload = {
+            "input_file": os.path.abspath(input_file),
+            "size": stat.st_size,
+            "mtime": int(stat.st_mtime),
+            "text_columns": list(text_columns),
+            "settings": settings,
+        }
+        blob = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+    @property
+    def rows_done(self) -> int:
+        """Rows covered by completed parts (parts are contiguous from row 0)."""
+        return self.parts[-1]["end"] if self.parts else 0
+
+    def load(self) -> bool:
+        """Load an existing manifest; returns True if it matches this run."""
+        if not os.path.exists(self._manifest_path):
+            return False
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return False
+        if manifest.get("run_key") != self.run_key:
+            return False
+        parts = manifest.get("parts", [])
+        if not all(os.path.exists(os.path.join(self.directory, p["file"])) for p in parts):
+            return False
+        self.parts = parts
+        return True
+
+    def reset(self) -> None:
+        """Discard any previous checkpoint and start an empty one."""
+        self.clear()
+        os.makedirs(self.directory, exist_ok=True)
+        self.parts = []
+        self._write_manifest()
+
+    def record_chunk(self, df: pd.DataFrame, start: int, stats: Optional[Dict] = None) -> None:
+        """Persist one chunk of results covering rows [start, start + len(df))."""
+        if start != self.rows_done:
+            raise ValueError(f"Checkpoint chunk starts at row {start}, expected {self.rows_done}")
+        name = f"part-{len(self.parts) + 1:05d}.pkl"
+        df.to_pickle(os.path.join(self.directory, name))
+        self.parts.append({
+            "file": name,
+            "start": start,
+            "end": start + len(df),
+            "stats": stats or {},
+        })
+        self._write_manifest()
+
+    def iter_parts(self) -> Iterator[Tuple[pd.DataFrame, Dict]]:
+        """Yield (results, stats) for each completed part, in row order."""
+        for part in self.parts:
+            yield pd.read_pickle(os.path.join(self.directory, part["file"])), part.get("stats", {})
+
+    def clear(self) -> None:
+        """Remove the checkpoint directory (after a successful run)."""
+        if os.path.isdir(self.directory):
+            shutil.rmtree(self.directory)
+        self.parts = []
+
+    def _write_manifest(self) -> None:
+        _atomic_write_json(self._manifest_path, {
+            "run_key": self.run_key,
+            "rows_done": self.rows_done,
+            "updated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "parts": self.parts,
+        })
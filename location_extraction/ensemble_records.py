@@ -0,0 +1,124 @@
+"""
+Compact per-location results of EnsembleExtractionStrategy.
+
+A LocationRecord holds four slots instead of a dict with a list of source
+strings:
+
+  location_id : int   - interned location name (see LOCATION_NAMES)
+  confidence  : float
+  sources     : int   - bitmask over SOURCES
+  in_database : bool
+
+Names and source labels are rendered only when output is written
+(record.location, source_label(record.sources)). Location ids are only
+meaningful within one process; records pickle by name, so results sent
+back from worker processes are re-interned on arrival.
+
+Usage:
+    records, candidates = ensemble.extract_records("Uber trip Sydney")
+    best = records[0]
+    best.location, best.confidence, source_label(best.sources)
+"""
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+# Extraction tiers in bit order
+SOURCES = ("aho_corasick", "regex", "spacy", "phonetic", "tfidf", "bow", "country")
+SOURCE_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(SOURCES)}
+
+
+def sources_mask(sources: Iterable[str]) -> int:
+    """Bitmask of a collection of source names."""
+    mask = 0
+    for source in sources:
+        mask |= SOURCE_BITS[source]
+    return mask
+
+
+# Every mask's names, sorted as extract_with_confidence() lists them
+_MASK_NAMES: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(sorted(name for name in SOURCES if mask & SOURCE_BITS[name]))
+    for mask in range(1 << len(SOURCES))
+)
+_MASK_LABELS: Tuple[str, ...] = tuple(", ".join(names) for names in _MASK_NAMES)
+
+
+def mask_sources(mask: int) -> Tuple[str, ...]:
+    """Source names in a bitmask, sorted."""
+    return _MASK_NAMES[mask]
+
+
+def source_label(mask: int) -> str:
+    """Source names in a bitmask as one comma-separated string."""
+    return _MASK_LABELS[mask]
+
+
+class LocationNames:
+    """Thread-safe location name <-> id interning (ids are process-local)."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def id(self, name: str) -> int:
+        location_id = self._ids.get(name)
+        if location_id is None:
+            with self._lock:
+                location_id = self._ids.get(name)
+                if location_id is None:
+                    self._names.append(name)
+                    location_id = self._ids[name] = len(self._names) - 1
+        return location_id
+
+    def name(self, location_id: int) -> str:
+        return self._names[location_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+LOCATION_NAMES = LocationNames()
+
+
+class LocationRecord:
+    """One located candidate (see module docstring)."""
+
+    __slots__ = ("location_id", "confidence", "sources", "in_database")
+
+    def __init__(self, location_id: int, confidence: float, sources: int, in_database: bool):
+        self.location_id = location_id
+        self.confidence = confidence
+        self.sources = sources
+        self.in_database = in_database
+
+    @classmethod
+    def from_name(cls, location: str, confidence: float, sources: int, in_database: bool) -> "LocationRecord":
+        return cls(LOCATION_NAMES.id(location), confidence, sources, in_database)
+
+    @property
+    def location(self) -> str:
+        return LOCATION_NAMES.name(self.location_id)
+
+    def as_dict(self) -> Dict:
+        """The extract_with_confidence() dict form."""
+        return {
+            "location": self.location,
+            "confidence": self.confidence,
+            "sources": list(mask_sources(self.sources)),
+            "in_database": self.in_database,
+        }
+
+    def __reduce__(self):
+        # Ids are process-local: pickle by name
+        return LocationRecord.from_name, (self.location, self.confidence, self.sources, self.in_database)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LocationRecord):
+            return NotImplemented
+        return (self.location_id, self.confidence, self.sources, self.in_database) == \
+            (other.location_id, other.confidence, other.sources, other.in_database)
+
+    def __repr__(self) -> str:
+        return (f"LocationRecord({self.location!r}, confidence={self.confidence}, "
+                f"sources={source_label(self.sources)!r}, in_database={self.in_database})")
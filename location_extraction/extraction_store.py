@@ -0,0 +1,162 @@
+"""
+Persistent cross-run store of ensemble extraction results.
+
+Each row holds the source-attributed candidates (location -> tiers that found
+it) for one normalized text, keyed by a hash of that text and the ensemble's
+config key (settings, gazetteer version, merge and tier code; see
+EnsembleExtractionStrategy.store_key). Texts seen in an earlier run with the
+same config are answered from the store without running any tier; a config
+change simply produces keys that are not stored yet.
+
+  <cache_dir>/extraction_store.sqlite
+    results(key TEXT PRIMARY KEY, sources TEXT)   -- sources as ordered JSON
+
+The database runs in WAL mode, so worker processes can read and write the
+same file. Connections are opened lazily per process.
+
+The store is capped at `max_entries` rows (DEFAULT_MAX_ENTRIES, roughly
+100-200 MB): once a write takes it over the cap, the oldest-written rows are
+deleted. Results only ever go stale by config changes, which write new keys
+and let old ones age out. To start afresh, call clear() or delete the file.
+
+Usage:
+    store = ExtractionStore("data/extraction_store.sqlite")
+    found = store.get_many(keys)           # key -> {location: {sources}}
+    store.put_many({key: results, ...})
+"""
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, Mapping, Optional, Set
+
+SourceMap = Dict[str, Set[str]]
+
+# Keys per SELECT ... IN (...) (below SQLite's default variable limit)
+_QUERY_CHUNK = 500
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+
+class ExtractionStore:
+    """Thread-safe sqlite3 key -> source map store (see module docstring)."""
+
+    def __init__(self, path: str, max_entries: Optional[int] = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries  # None: unbounded
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.pruned = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        # Upper bound on the row count (writes may replace rows), so the
+        # table is only counted when it may be over the cap
+        self._entries_bound = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection inherited through fork must not be used in the child
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, sources TEXT NOT NULL)")
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+            self._entries_bound = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete the oldest-written rows beyond max_entries (caller holds the lock)."""
+        if self.max_entries is None or self._entries_bound <= self.max_entries:
+            return
+        entries = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = entries - self.max_entries
+        if excess > 0:
+            # INSERT OR REPLACE gives rewritten rows a new rowid, so rowid order is write order
+            with conn:
+                conn.execute(
+                    "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY rowid LIMIT ?)",
+                    (excess,),
+                )
+            self.pruned += excess
+            entries -= excess
+        self._entries_bound = entries
+
+    @staticmethod
+    def _encode(results: Mapping[str, Iterable[str]]) -> str:
+        # Location order is kept: it is the ensemble's candidate order
+        return json.dumps({loc: sorted(sources) for loc, sources in results.items()})
+
+    @staticmethod
+    def _decode(blob: str) -> SourceMap:
+        return {loc: set(sources) for loc, sources in json.loads(blob).items()}
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, SourceMap]:
+        """Stored results for those of `keys` that are present."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, SourceMap] = {}
+        if not keys:
+            return found
+        with self._lock:
+            conn = self._connect()
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start:start + _QUERY_CHUNK]
+                rows = conn.execute(
+                    f"SELECT key, sources FROM results WHERE key IN ({','.join('?' * len(chunk))})", chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = self._decode(blob)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def get(self, key: str) -> Optional[SourceMap]:
+        return self.get_many([key]).get(key)
+
+    def put_many(self, items: Mapping[str, Mapping[str, Iterable[str]]]) -> None:
+        """Store results by key (one transaction)."""
+        if not items:
+            return
+        rows = [(key, self._encode(results)) for key, results in items.items()]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO results (key, sources) VALUES (?, ?)", rows)
+            self.writes += len(rows)
+            self._entries_bound += len(rows)
+            self._prune(conn)
+
+    def put(self, key: str, results: Mapping[str, Iterable[str]]) -> None:
+        self.put_many({key: results})
+
+    def clear(self) -> None:
+        """Delete every stored result."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM results")
+            conn.execute("VACUUM")
+            self._entries_bound = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Stored entries, plus this process's hits, misses, writes and pruned rows."""
+        with self._lock:
+            entries = self._connect().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            return {
+                "entries": entries, "hits": self.hits, "misses": self.misses,
+                "writes": self.writes, "pruned": self.pruned,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        return self.get_stats()["entries"]
@@ -1,10 +1,18 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 import numpy as np
 import pandas as pd
 
 from .location_db import AUSTRALIAN_LOCATIONS
 from .location_cache import LocationCache
-from .feature_calculator import FeatureCalculator
+from . import feature_calculator
+from .feature_calculator import (
+    FeatureCalculator,
+    GazetteerFeatureTable,
+    REFERENCE_FEATURES,
+    decode_categories,
+    reference_feature_name,
+)
+from .fingerprint import code_fingerprint, gazetteer_version
 from .location_validator import LocationValidator
 from .strategies import LocationExtractionStrategy, GeocodingStrategy
 from .strategies.geocoding import NominatimGeocodingStrategy, GoogleSearchGeocodingStrategy
@@ -15,6 +23,46 @@ CONFIG = {
     'enable_geocoding': True,
 }
 
+# Feature values for a text with no resolved location
+FEATURE_DEFAULTS = {
+    'locations_found': 0,
+    'location_names': '',
+    'primary_location': '',
+    'primary_state': '',
+    'primary_lat': np.nan,
+    'primary_lon': np.nan,
+    'distance_from_ref_km': np.nan,
+    'estimated_travel_hours': np.nan,
+    'is_international': 0,
+    'is_regional': 0,
+    'is_major_city': 0,
+    'is_local': 0,
+    'is_interstate': 0,
+    'is_remote': 0,
+    'travel_category': 'unknown',
+    'extracted_locations': '',
+    'extracted_count': 0,
+    'validation_confidence': 0.0,
+    'validation_reasons': '',
+    'is_valid_location': 0,
+}
+
+
+class ResolvedCandidate(NamedTuple):
+    """One candidate name, looked up and validated once."""
+    name: str
+    coords: Optional[Dict]
+    source: str  # 'location_cache', 'location_db', 'geocoder', 'memory'; '' if unresolved
+    is_valid: bool  # LocationValidator.is_valid_location()
+    is_confident: bool  # validate_with_confidence()['is_valid']
+    confidence: float
+    reasons: Tuple[str, ...]
+
+    @property
+    def usable(self) -> bool:
+        """Resolved and plausible: may be a text's primary location."""
+        return bool(self.coords) and self.is_valid
+
 
 class LocationExtractor:
     """Extract and geocode locations from expense descriptions."""
@@ -25,16 +73,79 @@ class LocationExtractor:
         strategy: Optional[LocationExtractionStrategy] = None,
         geocoding_strategy: Optional[GeocodingStrategy] = None,
         location_cache: Optional[LocationCache] = None,
+        reference_locations: Optional[Dict[str, Dict]] = None,
     ):
         self.locations_db = AUSTRALIAN_LOCATIONS
         self.reference = reference_location or CONFIG['reference_location']
+        # Extra named reference points, e.g. {'melbourne': {'lat': .., 'lon': .., 'state': 'VIC'}}
+        self.reference_locations = dict(reference_locations or {})
         self.cache = {}
+        self._coord_sources: Dict[str, str] = {}
         self.location_cache = location_cache
         self.validator = LocationValidator(self.locations_db)
 
         self.strategy = strategy
         self._geocoder = geocoding_strategy or GoogleSearchGeocodingStrategy(inner=NominatimGeocodingStrategy(country_hint="Australia"))
-        self._feature_calc = FeatureCalculator((self.reference['lat'], self.reference['lon']))
+        self._feature_table: Optional[GazetteerFeatureTable] = None
+        self._feature_table_key: Optional[Tuple] = None
+        self._build_feature_calc()
+
+    def _build_feature_calc(self) -> None:
+        self._feature_calc = FeatureCalculator(
+            (self.reference['lat'], self.reference['lon']),
+            reference_state=self.reference.get('state', 'NSW'),
+            references=self.reference_locations,
+        )
+        self._feature_table = None
+        # Defaults for the per-reference features of the extra reference points
+        self._feature_defaults = dict(FEATURE_DEFAULTS)
+        for key in self._feature_calc.references:
+            for name in REFERENCE_FEATURES:
+                name = name.replace('travel_category_code', 'travel_category')
+                self._feature_defaults[reference_feature_name(name, key)] = FEATURE_DEFAULTS[name]
+
+    def set_reference_location(self, reference_location: Dict) -> None:
+        """Change the reference point; the gazetteer feature table is rebuilt on next use."""
+        self.reference = reference_location
+        self._build_feature_calc()
+
+    def set_reference_locations(self, reference_locations: Dict[str, Dict]) -> None:
+        """Replace the extra named reference points (features for all are computed together)."""
+        self.reference_locations = dict(reference_locations)
+        self._build_feature_calc()
+
+    @property
+    def reference_keys(self) -> List[str]:
+        """Column keys of the extra reference points (see reference_feature_name)."""
+        return list(self._feature_calc.references)
+
+    @property
+    def feature_names(self) -> List[str]:
+        """Feature keys produced by extract_location_features(), in order."""
+        return list(self._feature_defaults)
+
+    def _gazetteer_table(self) -> GazetteerFeatureTable:
+        """
+        Travel features for every gazetteer entry against the current reference
+        point, rebuilt only when the reference or the gazetteer changes.
+        """
+        calc = self._feature_calc
+        key = (
+            calc.ref_lat, calc.ref_lon, calc.reference_state, tuple(calc.references.items()),
+            id(self.locations_db), len(self.locations_db),
+        )
+        if self._feature_table is None or self._feature_table_key != key:
+            self._feature_table = GazetteerFeatureTable(calc, self.locations_db)
+            self._feature_table_key = key
+        return self._feature_table
+
+    def _travel_inputs(self, coords: Dict) -> Tuple:
+        """(lat, lon, type, state) as fed to FeatureCalculator.travel_features."""
+        return (
+            coords['lat'], coords['lon'],
+            coords.get('type', ''),
+            coords.get('state', self._feature_calc.reference_state),
+        )
 
     def extract_locations(self, text: str) -> List[str]:
         if pd.isna(text) or not text:
@@ -73,9 +184,13 @@ class LocationExtractor:
         return []
 
     def get_coordinates(self, location_name: str, context: Optional[str] = None) -> Optional[Dict]:
+        return self._lookup_coordinates(location_name, context)[0]
+
+    def _lookup_coordinates(self, location_name: str, context: Optional[str] = None) -> Tuple[Optional[Dict], str]:
+        """get_coordinates() plus where the coordinates came from ('' if unresolved)."""
         location_name = location_name.lower().strip()
         if location_name in self.cache:
-            return self.cache[location_name]
+            return self.cache[location_name], self._coord_sources.get(location_name, 'memory')
 
         # Try persistent cache (overrides + previous lookups)
         if self.location_cache is not None:
@@ -87,32 +202,79 @@ class LocationExtractor:
                     'type': cached.get('type', ''),
                     'state': cached.get('state', ''),
                 }
-                self.cache[location_name] = coords
-                return coords
+                return self._remember(location_name, coords, 'location_cache'), 'location_cache'
             if confidence < 0:
                 # Known unresolvable (sentinel -1.0) — skip DB and API
-                return None
+                return None, ''
             # Not in persistent cache — fall through to DB/API
 
         # Try DB
         loc = self.locations_db.get(location_name)
         if loc:
             coords = {'lat': loc['lat'], 'lon': loc['lon'], 'type': loc.get('type', 'city'), 'state': loc.get('state', '')}
-            self.cache[location_name] = coords
+            self._remember(location_name, coords, 'location_db')
             if self.location_cache is not None:
                 self.location_cache.store(location_name, coords, source="location_db")
-            return coords
+            return coords, 'location_db'
 
         # Then API
         if self._geocoder:
             coords = self._geocoder.geocode(location_name, context)
             if coords:
-                self.cache[location_name] = coords
+                self._remember(location_name, coords, 'geocoder')
                 if self.location_cache is not None:
                     self.location_cache.store(location_name, coords, source="geocoder")
-                return coords
+                return coords, 'geocoder'
+
+        return None, ''
+
+    def _remember(self, location_name: str, coords: Dict, source: str) -> Dict:
+        self.cache[location_name] = coords
+        self._coord_sources[location_name] = source
+        return coords
 
-        return None
+    def resolve_candidate(self, location_name: str, context: Optional[str] = None) -> ResolvedCandidate:
+        """Look up and validate one candidate name (see ResolvedCandidate)."""
+        coords, source = self._lookup_coordinates(location_name, context)
+        if not coords:
+            return ResolvedCandidate(location_name, None, '', False, False, 0.0, ())
+        validation = self.validator.validate_with_confidence(location_name, coords)
+        return ResolvedCandidate(
+            name=location_name,
+            coords=coords,
+            source=source,
+            is_valid=self.validator.is_valid_location(location_name, coords),
+            is_confident=validation['is_valid'],
+            confidence=validation['confidence'],
+            reasons=tuple(validation['reasons']),
+        )
+
+    def _resolve_text_candidates(
+        self,
+        text: str,
+        candidates: Sequence[str],
+        allow_online_fallback: bool = False,
+    ) -> List[ResolvedCandidate]:
+        """
+        Resolve a text's candidates, each exactly once, and return the usable
+        ones in candidate order. If none is usable and online fallback is
+        enabled, the first usable unfiltered NER entity is returned instead.
+        """
+        records: Dict[str, ResolvedCandidate] = {}
+        for loc in candidates:
+            if loc not in records:
+                records[loc] = self.resolve_candidate(loc, text)
+        usable = [records[loc] for loc in candidates if records[loc].usable]
+
+        if not usable and allow_online_fallback:
+            tried = [l.lower() for l in candidates]
+            for loc in self._extract_unfiltered_locations(text):
+                if loc.lower() not in tried:
+                    record = self.resolve_candidate(loc, text)
+                    if record.usable:
+                        usable.append(record)
+                        break
+        return usable
 
     def _populate_coord_features(
         self,
@@ -138,66 +300,40 @@ class LocationExtractor:
         lat = coords.get('lat')
         lon = coords.get('lon')
         if lat is not None and lon is not None:
-            distance = self._feature_calc.distance_km(lat, lon)
-            features['distance_from_ref_km'] = round(distance, 2)
-            features['estimated_travel_hours'] = round(
-                self._feature_calc.est_travel_hours(distance), 2)
-
-            loc_type = coords.get('type', '')
-            features['is_international'] = int(loc_type == 'international')
-            features['is_regional'] = int(loc_type == 'regional')
-            features['is_major_city'] = int(loc_type == 'city')
-            features['is_local'] = int(distance <= 100)
-            features['is_remote'] = int(distance > 500)
-            features['is_interstate'] = int(
-                coords.get('state', 'NSW') != 'NSW'
-                and not features['is_international'])
-
-            if features['is_international']:
-                features['travel_category'] = 'international'
-            elif features['is_remote']:
-                features['travel_category'] = 'remote'
-            elif features['is_interstate']:
-                features['travel_category'] = 'interstate'
-            elif features['is_regional']:
-                features['travel_category'] = 'regional'
-            elif features['is_local']:
-                features['travel_category'] = 'local'
+            inputs = self._travel_inputs(coords)
+            table = self._gazetteer_table()
+            entry = table.lookup(location_name, inputs)
+            if entry is not None:
+                # Database coordinates: precomputed features
+                features.update(table.row(entry))
             else:
-                features['travel_category'] = 'domestic'
+                # Same kernel as the batch path, on a single row
+                lat, lon, loc_type, state = inputs
+                travel = decode_categories(
+                    self._feature_calc.travel_features([lat], [lon], types=[loc_type], states=[state]))
+                for name, values in travel.items():
+                    value = values[0]
+                    features[name] = value.item() if isinstance(value, np.generic) else value
 
         return features
 
-    def extract_location_features(self, text: str, allow_online_fallback: bool = False) -> Dict:
+    def extract_location_features(
+        self,
+        text: str,
+        allow_online_fallback: bool = False,
+        locations: Optional[List[str]] = None,
+    ) -> Dict:
         """
         Extract locations with hybrid approach:
         1. Extract DB-filtered locations from strategy
         2. Geocode using DB-first lookup (fast and reliable)
         3. If allow_online_fallback=True and no geocoded results found,
            try online extraction/geocoding for unmatched locations
+
+        If `locations` is given (e.g. candidates already extracted in a worker
+        process), step 1 is skipped and those candidates are geocoded instead.
         """
-        features = {
-            'locations_found': 0,
-            'location_names': '',
-            'primary_location': '',
-            'primary_state': '',
-            'primary_lat': np.nan,
-            'primary_lon': np.nan,
-            'distance_from_ref_km': np.nan,
-            'estimated_travel_hours': np.nan,
-            'is_international': 0,
-            'is_regional': 0,
-            'is_major_city': 0,
-            'is_local': 0,
-            'is_interstate': 0,
-            'is_remote': 0,
-            'travel_category': 'unknown',
-            'extracted_locations': '',
-            'extracted_count': 0,
-            'validation_confidence': 0.0,
-            'validation_reasons': '',
-            'is_valid_location': 0,
-        }
+        features = dict(self._feature_defaults)
 
         # Cache-first: check if the raw text is already resolved in persistent cache
         if self.location_cache is not None and text and not pd.isna(text):
@@ -207,54 +343,261 @@ class LocationExtractor:
             if confidence < 0:
                 return features  # known unresolvable — skip everything
 
-        locations = self.extract_locations(text)
+        if locations is None:
+            locations = self.extract_locations(text)
         if not locations:
             return features
 
         features['extracted_locations'] = ', '.join(locations)
         features['extracted_count'] = len(locations)
 
-        # Filter locations to only those that can be geocoded AND are valid
-        geocoded_locations = []
-        for loc in locations:
-            coords = self.get_coordinates(loc, text)
-            if coords and self.validator.is_valid_location(loc, coords):
-                geocoded_locations.append(loc)
-
-        # If no geocoded results and online fallback enabled, try extracting without DB filter
-        if not geocoded_locations and allow_online_fallback:
-            online_locations = self._extract_unfiltered_locations(text)
-            for loc in online_locations:
-                if loc.lower() not in [l.lower() for l in locations]:  # Skip already tried
-                    coords = self.get_coordinates(loc, text)
-                    if coords and self.validator.is_valid_location(loc, coords):
-                        geocoded_locations.append(loc)
-                        break  # Stop after finding one online location
-
-        features['locations_found'] = len(geocoded_locations)
-        if not geocoded_locations:
+        # Geocode + validate each candidate once; keep those that are usable
+        geocoded = self._resolve_text_candidates(text, locations, allow_online_fallback)
+
+        features['locations_found'] = len(geocoded)
+        if not geocoded:
             # Mark individual failed candidates as unresolvable
             if self.location_cache is not None and locations:
                 for loc in locations:
                     self.location_cache.store_unresolvable(loc)
             return features
 
-        primary = geocoded_locations[0]
-        coords = self.get_coordinates(primary, text)
-        if coords:
-            self._populate_coord_features(
-                features, coords,
-                location_name=primary,
-                geocoded_locations=geocoded_locations,
-            )
-            # Add confidence validation for the primary location
-            validation_result = self.validator.validate_with_confidence(primary, coords)
-            features['validation_confidence'] = validation_result['confidence']
-            features['validation_reasons'] = '; '.join(validation_result['reasons'])
-            features['is_valid_location'] = int(validation_result['is_valid'])
+        primary = geocoded[0]
+        self._populate_coord_features(
+            features, primary.coords,
+            location_name=primary.name,
+            geocoded_locations=[r.name for r in geocoded],
+        )
+        # Confidence validation for the primary location
+        features['validation_confidence'] = primary.confidence
+        features['validation_reasons'] = '; '.join(primary.reasons)
+        features['is_valid_location'] = int(primary.is_confident)
 
         return features
 
+    def extract_locations_batch(self, texts: Sequence) -> List[List[str]]:
+        """extract_locations() over many texts, batched if the strategy has `extract_batch`."""
+        out: List[List[str]] = [[] for _ in texts]
+        if self.strategy is None:
+            return out
+        idx = [i for i, t in enumerate(texts) if not pd.isna(t) and t]
+        batch = [str(texts[i]) for i in idx]
+        extract_batch = getattr(self.strategy, 'extract_batch', None)
+        if extract_batch is not None:
+            found = extract_batch(batch)
+        else:
+            found = [self.strategy.extract(t) for t in batch]
+        for i, locations in zip(idx, found):
+            out[i] = locations
+        return out
+
+    def extract_location_features_batch(
+        self,
+        texts: Sequence,
+        allow_online_fallback: bool = False,
+        locations: Optional[Sequence[List[str]]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        extract_location_features() over many texts, returned as columns.
+
+        Candidate extraction runs as one batch (see extract_locations_batch).
+        Cache lookups and geocoding still go row by row in input order, since
+        entries stored for one row can change later lookups, but validation
+        is memoized per (name, coordinates) and the distance features for all
+        resolved rows are computed in one vectorized step. The output matches
+        calling extract_location_features() on each text in turn.
+
+        Equivalent to features_from_resolution(resolve_batch(...)); the two
+        halves can be run separately to store resolutions between runs.
+
+        Returns a dict of arrays (one per feature, length len(texts)).
+        """
+        return self.features_from_resolution(
+            self.resolve_batch(texts, allow_online_fallback=allow_online_fallback, locations=locations))
+
+    def resolve_batch(
+        self,
+        texts: Sequence,
+        allow_online_fallback: bool = False,
+        locations: Optional[Sequence[List[str]]] = None,
+    ) -> Dict[str, List]:
+        """
+        Cache lookups, geocoding and validity filtering for many texts.
+
+        Returns per-text lists:
+          - extracted : candidate names tried (None if extraction was skipped)
+          - geocoded  : candidates that geocoded and passed is_valid_location
+                        (None if the text was resolved from the cache as a whole)
+          - primary   : the geocoded candidate used for features ('' if none)
+          - coords    : coordinates of the primary location (or of the cached
+                        text), None if unresolved
+          - records   : the primary's ResolvedCandidate (None if no primary);
+                        not stored with the other lists, see stages.py
+        """
+        texts = list(texts)
+        n = len(texts)
+        if locations is None:
+            locations = self.extract_locations_batch(texts)
+
+        resolution: Dict[str, List] = {
+            'extracted': [None] * n,
+            'geocoded': [None] * n,
+            'primary': [''] * n,
+            'coords': [None] * n,
+            'records': [None] * n,
+        }
+        for i, text in enumerate(texts):
+            # Cache-first: check if the raw text is already resolved in persistent cache
+            if self.location_cache is not None and text and not pd.isna(text):
+                cached, confidence = self.location_cache.lookup(str(text))
+                if cached and cached.get("resolved", True) and confidence > 0:
+                    resolution['coords'][i] = cached
+                    continue
+                if confidence < 0:
+                    continue  # known unresolvable
+
+            candidates = locations[i]
+            if not candidates:
+                continue
+            resolution['extracted'][i] = list(candidates)
+
+            geocoded = self._resolve_text_candidates(text, candidates, allow_online_fallback)
+            resolution['geocoded'][i] = [r.name for r in geocoded]
+            if not geocoded:
+                if self.location_cache is not None:
+                    for loc in candidates:
+                        self.location_cache.store_unresolvable(loc)
+                continue
+
+            primary = geocoded[0]
+            resolution['primary'][i] = primary.name
+            resolution['coords'][i] = primary.coords
+            resolution['records'][i] = primary
+
+        return resolution
+
+    def features_from_resolution(self, resolution: Dict[str, List]) -> Dict[str, np.ndarray]:
+        """Feature columns for resolve_batch() output (validation confidence + travel features)."""
+        n = len(resolution['coords'])
+        columns: Dict[str, np.ndarray] = {}
+        for name, default in self._feature_defaults.items():
+            dtype = object if isinstance(default, str) else type(default)
+            columns[name] = np.full(n, default, dtype=dtype)
+
+        records = resolution.get('records')
+        # Rows with a primary location: (row, coords, location_name, geocoded_locations)
+        resolved: List[Tuple[int, Dict, str, Optional[List[str]]]] = []
+
+        for i in range(n):
+            extracted = resolution['extracted'][i]
+            if extracted:
+                columns['extracted_locations'][i] = ', '.join(extracted)
+                columns['extracted_count'][i] = len(extracted)
+            geocoded_locations = resolution['geocoded'][i]
+            if geocoded_locations is not None:
+                columns['locations_found'][i] = len(geocoded_locations)
+            coords = resolution['coords'][i]
+            if not coords:
+                continue
+            if geocoded_locations is None:
+                # Whole text resolved from the persistent cache
+                resolved.append((i, coords, '', None))
+                continue
+
+            primary = resolution['primary'][i]
+            resolved.append((i, coords, primary, geocoded_locations))
+            record = records[i] if records is not None else None
+            if record is not None:
+                confidence, reasons, is_valid = record.confidence, record.reasons, record.is_confident
+            else:
+                # Stored resolutions carry no validation; run it for the primary
+                validation_result = self.validator.validate_with_confidence(primary, coords)
+                confidence, reasons, is_valid = (
+                    validation_result['confidence'], validation_result['reasons'], validation_result['is_valid'])
+            columns['validation_confidence'][i] = confidence
+            columns['validation_reasons'][i] = '; '.join(reasons)
+            columns['is_valid_location'][i] = int(is_valid)
+
+        self._populate_coord_columns(columns, resolved)
+        return columns
+
+    def resolution_signature(self) -> Dict:
+        """Settings that determine resolve_batch() output for given candidates."""
+        return {
+            'gazetteer_version': gazetteer_version(self.locations_db),
+            'geocoder': type(self._geocoder).__name__ if self._geocoder else None,
+            'location_cache': self.location_cache.overrides_version() if self.location_cache is not None else None,
+            'validator': self.validator.filter_signature(),
+            'code': code_fingerprint(
+                LocationExtractor.resolve_batch,
+                LocationExtractor._resolve_text_candidates,
+                LocationExtractor.resolve_candidate,
+                LocationExtractor._lookup_coordinates,
+                ResolvedCandidate,
+            ),
+        }
+
+    def feature_signature(self) -> Dict:
+        """Settings that determine features_from_resolution() output for given resolutions."""
+        return {
+            'reference_location': self.reference,
+            'reference_locations': self.reference_locations,
+            'validator': self.validator.confidence_signature(),
+            'code': code_fingerprint(
+                feature_calculator,
+                LocationExtractor.features_from_resolution,
+                LocationExtractor._populate_coord_columns,
+            ),
+        }
+
+    def _populate_coord_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        resolved: List[Tuple[int, Dict, str, Optional[List[str]]]],
+    ) -> None:
+        """Columnar _populate_coord_features() for every resolved row at once."""
+        if not resolved:
+            return
+        for i, coords, location_name, geocoded_locations in resolved:
+            if geocoded_locations:
+                columns['locations_found'][i] = len(geocoded_locations)
+                columns['location_names'][i] = ', '.join(geocoded_locations)
+            else:
+                columns['locations_found'][i] = 1
+                columns['location_names'][i] = location_name
+            columns['primary_location'][i] = (
+                location_name or coords.get('display_name') or coords.get('city', ''))
+            lat, lon = coords.get('lat', np.nan), coords.get('lon', np.nan)
+            columns['primary_lat'][i] = np.nan if lat is None else lat
+            columns['primary_lon'][i] = np.nan if lon is None else lon
+            columns['primary_state'][i] = coords.get('state', '')
+
+        # Distance features only for rows whose coordinates are complete
+        rows = [r for r in resolved if r[1].get('lat') is not None and r[1].get('lon') is not None]
+        if not rows:
+            return
+        # Rows resolved from the database gather precomputed table entries;
+        # the rest go through the kernel
+        table = self._gazetteer_table()
+        inputs = [self._travel_inputs(r[1]) for r in rows]
+        entries = [table.lookup(r[2], x) for r, x in zip(rows, inputs)]
+        hit = np.array([e is not None for e in entries], dtype=bool)
+        idx = np.array([r[0] for r in rows])
+
+        if hit.any():
+            hit_idx = idx[hit]
+            entry_idx = np.array([e for e in entries if e is not None])
+            for name, values in table.features.items():
+                columns[name][hit_idx] = values[entry_idx]
+
+        if not hit.all():
+            miss = [x for x, h in zip(inputs, hit) if not h]
+            lats, lons, types, states = zip(*miss)
+            travel = decode_categories(self._feature_calc.travel_features(lats, lons, types=types, states=states))
+            miss_idx = idx[~hit]
+            for name, values in travel.items():
+                columns[name][miss_idx] = values
+
     def save_cache(self) -> None:
         """Persist the location cache to disk."""
         if self.location_cache is not None:
@@ -1,11 +1,67 @@
 import math
+import re
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Travel categories in code order (see FeatureCalculator.travel_features)
+TRAVEL_CATEGORIES = ('unknown', 'international', 'remote', 'interstate', 'regional', 'local', 'domestic')
+CATEGORY_CODES = {name: code for code, name in enumerate(TRAVEL_CATEGORIES)}
+_CATEGORY_NAMES = np.array(TRAVEL_CATEGORIES, dtype=object)
+
+# Features that depend on the reference point; with extra reference points
+# each gets a per-reference copy (see reference_feature_name)
+REFERENCE_FEATURES = (
+    'distance_from_ref_km', 'estimated_travel_hours',
+    'is_local', 'is_remote', 'is_interstate', 'travel_category_code',
+)
+
+
+def reference_key(name: str) -> str:
+    """Column-safe key for a reference point name ('Perth CBD' -> 'perth_cbd')."""
+    return re.sub(r'\W+', '_', name.lower()).strip('_')
+
+
+def reference_feature_name(feature: str, key: str) -> str:
+    """Per-reference column name, e.g. distance_from_melbourne_km."""
+    if feature == 'distance_from_ref_km':
+        return f'distance_from_{key}_km'
+    return f'{feature}_{key}'
+
+
+def decode_categories(travel: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Replace every travel_category_code* array with travel_category* names."""
+    out = {}
+    for name, values in travel.items():
+        if name.startswith('travel_category_code'):
+            out[name.replace('travel_category_code', 'travel_category', 1)] = FeatureCalculator.category_names(values)
+        else:
+            out[name] = values
+    return out
 
 
 class FeatureCalculator:
-    """Compute distance-based features and simple travel estimates."""
+    """
+    Compute distance-based features and simple travel estimates.
 
-    def __init__(self, reference_coords):
+    Besides the main reference point, `references` can name extra points
+    ({'melbourne': {'lat': ..., 'lon': ..., 'state': 'VIC'}, ...}); their
+    features are computed in the same vectorized pass as per-reference
+    columns (distance_from_melbourne_km, travel_category_code_melbourne, ...).
+    """
+
+    def __init__(
+        self,
+        reference_coords,
+        reference_state: str = 'NSW',
+        references: Optional[Mapping[str, Mapping]] = None,
+    ):
         self.ref_lat, self.ref_lon = reference_coords
+        self.reference_state = reference_state
+        self.references: Dict[str, Tuple[float, float, str]] = {
+            reference_key(name): (float(ref['lat']), float(ref['lon']), ref.get('state', reference_state))
+            for name, ref in (references or {}).items()
+        }
 
     @staticmethod
     def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -17,6 +73,19 @@ class FeatureCalculator:
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         return R * c
 
+    @staticmethod
+    def _haversine_array(ref_lats: np.ndarray, ref_lons: np.ndarray, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Distances (km) from each of R reference points to each of n points, shape (R, n)."""
+        R = 6371.0
+        ref_lats = np.asarray(ref_lats, dtype=float)[:, None]
+        ref_lons = np.asarray(ref_lons, dtype=float)[:, None]
+        phi1, phi2 = np.radians(ref_lats), np.radians(lats)[None, :]
+        dphi = np.radians(lats[None, :] - ref_lats)
+        dlmb = np.radians(lons[None, :] - ref_lons)
+        a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlmb / 2) ** 2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return R * c
+
     def distance_km(self, lat: float, lon: float) -> float:
         return self._haversine(self.ref_lat, self.ref_lon, lat, lon)
 
@@ -26,3 +95,141 @@ class FeatureCalculator:
         if distance_km < 300:
             return distance_km / 70.0
         return 2.5 + (distance_km / 800.0)
+
+    def distance_km_array(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """Vectorized distance_km() over arrays of latitudes and longitudes."""
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        return self._haversine_array([self.ref_lat], [self.ref_lon], lats, lons)[0]
+
+    @staticmethod
+    def est_travel_hours_array(distance_km: np.ndarray) -> np.ndarray:
+        """Vectorized est_travel_hours()."""
+        d = np.asarray(distance_km, dtype=float)
+        hours = np.where(d < 300, d / 70.0, 2.5 + d / 800.0)
+        return np.where(d <= 0, 0.0, hours)
+
+    def travel_features(
+        self,
+        lats: np.ndarray,
+        lons: np.ndarray,
+        types: Optional[Sequence[str]] = None,
+        states: Optional[Sequence[str]] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Distance, travel time, flags and travel category for whole columns of
+        coordinates in one call.
+
+        `types` are gazetteer location types ('city', 'regional',
+        'international', ...) and `states` the state codes (missing entries
+        count as the main reference's state). Rows with a NaN coordinate get
+        NaN distances, zero flags and the 'unknown' category.
+
+        Returns distance_from_ref_km / estimated_travel_hours (rounded to 2
+        places), int8 is_* flags and int8 travel_category_code (an index into
+        TRAVEL_CATEGORIES), plus the REFERENCE_FEATURES for every extra
+        reference point under reference_feature_name(). All reference points
+        are evaluated together as one (references x rows) array.
+        """
+        lats = np.asarray(lats, dtype=float)
+        lons = np.asarray(lons, dtype=float)
+        n = len(lats)
+        types = np.asarray(types if types is not None else [''] * n, dtype=object)
+        states = np.asarray(states if states is not None else [self.reference_state] * n, dtype=object)
+
+        points = [(self.ref_lat, self.ref_lon, self.reference_state)] + list(self.references.values())
+        ref_lats, ref_lons, ref_states = zip(*points)
+
+        known = ~(np.isnan(lats) | np.isnan(lons))
+        distance = self._haversine_array(ref_lats, ref_lons, lats, lons)
+        hours = self.est_travel_hours_array(distance)
+
+        # Reference-independent flags, shape (n,)
+        is_international = known & (types == 'international')
+        is_regional = known & (types == 'regional')
+        is_major_city = known & (types == 'city')
+
+        # Reference-dependent flags, shape (R, n)
+        is_remote = known & (distance > 500)
+        is_interstate = known & (states[None, :] != np.asarray(ref_states, dtype=object)[:, None]) & ~is_international
+        is_local = known & (distance <= 100)
+
+        # First matching rule wins, as in the scalar category logic
+        code = np.select(
+            [
+                np.broadcast_to(is_international, distance.shape), is_remote, is_interstate,
+                np.broadcast_to(is_regional, distance.shape), is_local, np.broadcast_to(known, distance.shape),
+            ],
+            [CATEGORY_CODES[c] for c in ('international', 'remote', 'interstate', 'regional', 'local', 'domestic')],
+            default=CATEGORY_CODES['unknown'],
+        ).astype(np.int8)
+
+        per_reference = {
+            'distance_from_ref_km': np.round(distance, 2),
+            'estimated_travel_hours': np.round(hours, 2),
+            'is_local': is_local.astype(np.int8),
+            'is_remote': is_remote.astype(np.int8),
+            'is_interstate': is_interstate.astype(np.int8),
+            'travel_category_code': code,
+        }
+        features = {
+            'distance_from_ref_km': per_reference['distance_from_ref_km'][0],
+            'estimated_travel_hours': per_reference['estimated_travel_hours'][0],
+            'is_international': is_international.astype(np.int8),
+            'is_regional': is_regional.astype(np.int8),
+            'is_major_city': is_major_city.astype(np.int8),
+            'is_local': per_reference['is_local'][0],
+            'is_interstate': per_reference['is_interstate'][0],
+            'is_remote': per_reference['is_remote'][0],
+            'travel_category_code': code[0],
+        }
+        for r, key in enumerate(self.references, start=1):
+            for name in REFERENCE_FEATURES:
+                features[reference_feature_name(name, key)] = per_reference[name][r]
+        return features
+
+    @staticmethod
+    def category_names(codes: np.ndarray) -> np.ndarray:
+        """Map travel_category_code values back to category names (object array)."""
+        return _CATEGORY_NAMES[np.asarray(codes, dtype=np.intp)]
+
+
+class GazetteerFeatureTable:
+    """
+    Travel features precomputed for every gazetteer entry against one
+    reference point, so a row resolved from the database is an index lookup.
+
+    An entry is only used if a row's coordinates are exactly the kernel
+    inputs the entry was computed from (lat, lon, type, state), i.e. they
+    came from the database rather than from an override or the geocoder.
+    """
+
+    def __init__(self, calculator: FeatureCalculator, locations_db: Mapping[str, Mapping]):
+        self.index: Dict[str, int] = {}
+        self.inputs: List[Tuple] = []
+        for name, loc in locations_db.items():
+            self.index[name.lower().strip()] = len(self.inputs)
+            # Same defaults LocationExtractor.get_coordinates applies to DB entries
+            self.inputs.append((loc['lat'], loc['lon'], loc.get('type', 'city'), loc.get('state', '')))
+        lats, lons, types, states = zip(*self.inputs) if self.inputs else ((), (), (), ())
+        self.features = decode_categories(calculator.travel_features(lats, lons, types=types, states=states))
+        self._rows: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.inputs)
+
+    def lookup(self, name: str, inputs: Tuple) -> Optional[int]:
+        """Entry index for `name` if its precomputed inputs match `inputs`, else None."""
+        i = self.index.get(name.lower().strip()) if name else None
+        if i is None or self.inputs[i] != inputs:
+            return None
+        return i
+
+    def row(self, i: int) -> Dict[str, Any]:
+        """Features of entry `i` as Python scalars (travel categories as names)."""
+        if i not in self._rows:
+            self._rows[i] = {
+                name: values[i].item() if isinstance(values[i], np.generic) else values[i]
+                for name, values in self.features.items()
+            }
+        return self._rows[i]
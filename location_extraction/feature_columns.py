@@ -0,0 +1,150 @@
+"""
+Columnar accumulation of per-text extraction results.
+
+Results are written straight into preallocated, typed arrays instead of being
+kept as one Python dict per row and turned into a DataFrame at the end:
+
+  - float32 : coordinates, distances, travel hours, confidences
+  - int8    : 0/1 flags
+  - int16   : small counts
+  - bool    : ensemble_in_database
+  - dictionary-encoded strings (int32 codes + vocabulary), emitted as
+    pandas Categoricals: states, travel categories, location names, sources
+
+Usage:
+    columns = FeatureColumns(len(unique_texts))
+    for i, result in enumerate(results):
+        columns.set_row(i, result)
+    features_df = columns.to_frame(codes)   # fan unique rows out to all rows
+"""
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .feature_calculator import REFERENCE_FEATURES, reference_feature_name
+
+# Column -> storage kind, in output order (ensemble fields, then extractor features)
+FEATURE_SCHEMA: Dict[str, str] = {
+    "ensemble_location": "dict",
+    "ensemble_confidence": "float32",
+    "ensemble_sources": "dict",
+    "ensemble_in_database": "bool",
+    "ensemble_all_locations": "dict",
+    "ensemble_num_locations": "int16",
+    "locations_found": "int16",
+    "location_names": "dict",
+    "primary_location": "dict",
+    "primary_state": "dict",
+    "primary_lat": "float32",
+    "primary_lon": "float32",
+    "distance_from_ref_km": "float32",
+    "estimated_travel_hours": "float32",
+    "is_international": "int8",
+    "is_regional": "int8",
+    "is_major_city": "int8",
+    "is_local": "int8",
+    "is_interstate": "int8",
+    "is_remote": "int8",
+    "travel_category": "dict",
+    "extracted_locations": "dict",
+    "extracted_count": "int16",
+    "validation_confidence": "float32",
+    "validation_reasons": "dict",
+    "is_valid_location": "int8",
+}
+
+
+def feature_schema(reference_keys: Sequence[str] = ()) -> Dict[str, str]:
+    """FEATURE_SCHEMA plus the per-reference columns of each extra reference point."""
+    schema = dict(FEATURE_SCHEMA)
+    for key in reference_keys:
+        for name in REFERENCE_FEATURES:
+            name = name.replace("travel_category_code", "travel_category")
+            schema[reference_feature_name(name, key)] = FEATURE_SCHEMA[name]
+    return schema
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and value != value)
+
+
+class _DictColumn:
+    """String column stored as int32 codes into a growing vocabulary."""
+
+    def __init__(self, n: int):
+        self.codes = np.full(n, -1, dtype=np.int32)
+        self.vocab: Dict[str, int] = {}
+
+    def set(self, i: int, value: Any) -> None:
+        if _is_missing(value):
+            return
+        value = str(value)
+        code = self.vocab.get(value)
+        if code is None:
+            code = self.vocab[value] = len(self.vocab)
+        self.codes[i] = code
+
+    def take(self, rows: np.ndarray) -> pd.Categorical:
+        return pd.Categorical.from_codes(self.codes[rows], categories=list(self.vocab))
+
+
+class FeatureColumns:
+    """Preallocated typed columns for `n` result rows."""
+
+    def __init__(self, n: int, schema: Optional[Dict[str, str]] = None):
+        self.n = n
+        self.schema = dict(schema or FEATURE_SCHEMA)
+        self._columns: Dict[str, Any] = {}
+        for name, kind in self.schema.items():
+            if kind == "dict":
+                self._columns[name] = _DictColumn(n)
+            elif kind.startswith("float"):
+                self._columns[name] = np.full(n, np.nan, dtype=kind)
+            else:
+                self._columns[name] = np.zeros(n, dtype=kind)
+        # Keys outside the schema (e.g. from older prior outputs) are kept as objects
+        self._extra: Dict[str, np.ndarray] = {}
+
+    def set_row(self, i: int, result: Dict[str, Any]) -> None:
+        """Store one result dict (ensemble fields + extractor features) at row `i`."""
+        for name, value in result.items():
+            column = self._columns.get(name)
+            if column is None:
+                if name not in self._extra:
+                    self._extra[name] = np.full(self.n, None, dtype=object)
+                self._extra[name][i] = value
+            elif isinstance(column, _DictColumn):
+                column.set(i, value)
+            elif not _is_missing(value):
+                column[i] = value
+            elif column.dtype.kind == "f":
+                column[i] = np.nan
+
+    def set_columns(self, rows: Sequence[int], data: Dict[str, Sequence]) -> None:
+        """Store whole columns (e.g. extract_location_features_batch output) at `rows`."""
+        rows = np.asarray(rows, dtype=np.intp)
+        for name, values in data.items():
+            column = self._columns.get(name)
+            if isinstance(column, np.ndarray):
+                column[rows] = values
+            else:
+                for i, value in zip(rows, values):
+                    self.set_row(int(i), {name: value})
+
+    def to_frame(self, rows: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        """
+        Build the feature DataFrame, optionally gathering `rows` (e.g. the
+        dedup codes that map every input row to its unique text).
+        """
+        idx = np.arange(self.n) if rows is None else np.asarray(rows)
+        data: Dict[str, Any] = {}
+        for name, column in self._columns.items():
+            data[name] = column.take(idx) if isinstance(column, _DictColumn) else column[idx]
+        for name, column in self._extra.items():
+            data[name] = column[idx]
+        return pd.DataFrame(data)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns) + list(self._extra)
@@ -0,0 +1,125 @@
+"""
+Row content fingerprints for incremental re-runs.
+
+Each row's combined text is hashed together with a fingerprint of everything
+that determines its features: the ensemble configuration, the gazetteer
+version and the feature settings (reference location, online geocoding).
+Rows whose fingerprint already appears in a prior output file can reuse the
+stored features instead of going through extraction and geocoding again.
+"""
+import hashlib
+import inspect
+import json
+import os
+from typing import Dict, Iterable, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from .feature_columns import FEATURE_SCHEMA
+
+# Output columns that describe the row itself rather than its extracted features
+ROW_COLUMNS = {"row_index", "combined_text", "row_fingerprint", "reference_location"}
+
+# String feature columns a fresh run fills with "" rather than None. CSV and
+# Excel store both as a blank cell, which pandas reads back as NaN
+EMPTY_STRING_COLUMNS = {
+    name for name, kind in FEATURE_SCHEMA.items() if kind == "dict" and name != "ensemble_location"
+}
+BLANK_AS_NA_FORMATS = {".xlsx", ".xlsm", ".csv"}
+
+
+def gazetteer_version(locations_db: Mapping[str, Mapping]) -> str:
+    """Stable content hash of a locations database (names, coordinates, states, types)."""
+    blob = json.dumps(locations_db, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def config_fingerprint(settings: Mapping) -> str:
+    """Hash a settings mapping (must be JSON-serializable, order-independent)."""
+    blob = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def code_fingerprint(*objects) -> str:
+    """
+    Hash the source of functions, classes or modules, so stored results can be
+    invalidated when the code that produced them changes (e.g. a formula).
+    """
+    h = hashlib.sha1()
+    for obj in objects:
+        try:
+            source = inspect.getsource(obj)
+        except (OSError, TypeError):
+            source = getattr(obj, "__qualname__", repr(obj))
+        h.update(source.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def text_fingerprint(text: str, config_fp: str) -> str:
+    """Fingerprint one combined text under a given config fingerprint."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(config_fp.encode("utf-8"))
+    h.update(b"\x1f")
+    h.update(str(text).encode("utf-8"))
+    return h.hexdigest()
+
+
+class PriorResults:
+    """
+    Features from earlier output files, indexed by row fingerprint.
+
+    Usage:
+        prior = PriorResults(["data/wp2_features.parquet"], text_columns)
+        features = prior.get(fingerprint)   # dict of feature columns, or None
+    """
+
+    def __init__(self, paths: Iterable[str] = (), text_columns: Sequence[str] = ()):
+        self.text_columns = set(text_columns)
+        self._rows: Dict[str, Dict] = {}
+        for path in paths:
+            self.load(path)
+
+    @staticmethod
+    def _read(path: str) -> pd.DataFrame:
+        ext = os.path.splitext(path)[1].lower()
+        if ext in (".xlsx", ".xlsm"):
+            return pd.read_excel(path)
+        if ext == ".csv":
+            return pd.read_csv(path)
+        if ext in (".parquet", ".pq"):
+            return pd.read_parquet(path)
+        if ext == ".jsonl":
+            return pd.read_json(path, lines=True)
+        raise ValueError(f"Unsupported prior output format '{ext}' for {path}")
+
+    def load(self, path: str) -> int:
+        """Index one prior output file; returns the number of new fingerprints."""
+        df = self._read(path)
+        if os.path.splitext(path)[1].lower() in BLANK_AS_NA_FORMATS:
+            # Blank cells in these columns were "" when the file was written
+            for col in EMPTY_STRING_COLUMNS & set(df.columns):
+                df[col] = df[col].astype(object).where(df[col].notna(), "")
+        if "row_fingerprint" not in df.columns:
+            raise ValueError(f"{path} has no row_fingerprint column (written by an older pipeline?)")
+        feature_cols = [c for c in df.columns if c not in ROW_COLUMNS and c not in self.text_columns]
+        if "reference_location" in df.columns:
+            # Rows that used another reference point no longer hold the main
+            # reference's features in the unsuffixed columns
+            df = df[df["reference_location"].isna() | df["reference_location"].eq("")]
+        df = df.drop_duplicates("row_fingerprint")
+        df = df[~df["row_fingerprint"].isin(list(self._rows))]
+        features = df[feature_cols].astype(object).where(df[feature_cols].notna(), None)
+        for fp, row in zip(df["row_fingerprint"], features.to_dict("records")):
+            self._rows[fp] = row
+        return len(df)
+
+    def get(self, fingerprint: str) -> Optional[Dict]:
+        """Stored features for a fingerprint (a fresh copy), or None."""
+        row = self._rows.get(fingerprint)
+        return dict(row) if row is not None else None
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self._rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
@@ -19,6 +19,8 @@ from typing import Dict, List, Optional, Tuple
 
 from rapidfuzz import fuzz, process
 
+from .fingerprint import config_fingerprint
+
 
 class LocationCache:
     """Persistent location cache with fuzzy matching and frequency-weighted lookups."""
@@ -266,6 +268,13 @@ class LocationCache:
         self._overrides.setdefault("overrides", {})[key] = entry
         self._rebuild_keys()
 
+    def overrides_version(self) -> str:
+        """Content hash of the manual overrides (they take precedence over every other lookup)."""
+        return config_fingerprint({
+            "overrides": self._overrides.get("overrides", {}),
+            "fuzzy_threshold": self.fuzzy_threshold,
+        })
+
     def get_stats(self) -> dict:
         """Return summary statistics about the cache."""
         entries = self._cache.get("entries", {})
@@ -310,6 +319,14 @@ class LocationCache:
         unresolved.sort(key=lambda e: e.get("hit_count", 0), reverse=True)
         return unresolved
 
+    @staticmethod
+    def _write_json(path: str, data: dict) -> None:
+        """Write to a temp file, then rename, so a killed run never leaves a truncated file."""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
     def save(self) -> None:
         """Persist both JSON files to disk (pretty-printed, human-readable)."""
         os.makedirs(self.cache_dir, exist_ok=True)
@@ -319,8 +336,5 @@ class LocationCache:
             self._cache.get("entries", {})
         )
 
-        with open(self._cache_path, "w", encoding="utf-8") as f:
-            json.dump(self._cache, f, indent=2, ensure_ascii=False)
-
-        with open(self._overrides_path, "w", encoding="utf-8") as f:
-            json.dump(self._overrides, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        self._write_json(self._cache_path, self._cache)
+        self._write_json(self._overrides_path, self._overrides)
\ No newline at end of file
@@ -1,7 +1,14 @@
 """
 Location validation for filtering implausible and out-of-Australia matches.
 """
-from typing import Optional, Dict
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Pattern, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint import code_fingerprint, config_fingerprint
 
 # Australian states and territories
 AUSTRALIAN_STATES = {
@@ -47,6 +54,9 @@ BUSINESS_INDICATORS = {
     'travel', 'tourism', 'agency', 'bureau', 'centre', 'center'
 }
 
+# Australia's rough geographic bounds
+AUSTRALIA_BOUNDS = {'lat_min': -44, 'lat_max': -10, 'lon_min': 113, 'lon_max': 154}
+
 # State-specific coordinate bounds for more precise validation
 STATE_BOUNDS = {
     'NSW': {'lat_min': -37.5, 'lat_max': -28.0, 'lon_min': 140.0, 'lon_max': 154.0},
@@ -83,19 +93,69 @@ CONFIDENCE_THRESHOLDS = {
 # Minimum location name length
 MIN_LOCATION_LENGTH = 3
 
+# Single-word endings that make a name a plausible location
+LOCATION_SUFFIXES = ('ton', 'ville', 'burg', 'field', 'hill', 'wood', 'brook', 'vale', 'bay', 'beach')
+
+
+def _substring_matcher(indicators) -> Pattern:
+    """
+    One regex that finds any of `indicators` as a substring. The alternation
+    is factored into a prefix trie ('b(?:ar|ank(?:ing)?)'), so the regex
+    engine tests each character once instead of once per indicator.
+    """
+    trie: Dict[str, Dict] = {}
+    for word in indicators:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node: Dict[str, Dict]) -> str:
+        alternatives = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ''
+        if len(alternatives) == 1 and '' not in node:
+            return alternatives[0]
+        group = '(?:' + '|'.join(alternatives) + ')'
+        return group + '?' if '' in node else group
+
+    return re.compile(build(trie) if trie else r'(?!)')
+
+
+def coords_signature(coords: Optional[Dict]) -> Optional[Tuple]:
+    """Hashable view of the coordinate fields the validator looks at."""
+    if coords is None:
+        return None
+    # Emptiness is part of the key: the checks branch on `if coords:`, so {}
+    # and a dict with none of the fields below are validated differently
+    return (bool(coords),) + tuple((k, coords[k]) for k in ('lat', 'lon', 'state', 'type') if k in coords)
+
 
 class LocationValidator:
     """Validates extracted locations for plausibility and Australian origin."""
     
-    def __init__(self, australian_locations_db: Optional[Dict] = None):
+    def __init__(self, australian_locations_db: Optional[Dict] = None, memo_size: int = 65536):
         """
         Initialize validator.
         
         Args:
             australian_locations_db: Dictionary of known Australian locations
+            memo_size: Results kept per (name, coordinates) in the LRU memo
+                (0 disables memoization)
         """
         self.db = australian_locations_db or {}
         self.db_keys = {k.lower() for k in self.db.keys()}
+
+        # Rule sets compiled once: each indicator set becomes one alternation
+        self._international_re = _substring_matcher(INTERNATIONAL_INDICATORS)
+        self._business_re = _substring_matcher(BUSINESS_INDICATORS)
+        self._pattern_re = re.compile('|'.join(f'(?:{p})' for p in LOCATION_PATTERNS) or r'(?!)')
+
+        # LRU memo of results keyed by (method, name, coords_signature)
+        self.memo_size = memo_size
+        self._memo: OrderedDict = OrderedDict()
+        self.memo_hits = 0
+        self.memo_misses = 0
         
         # Create reverse mapping for state validation
         self.state_locations = {}
@@ -106,6 +166,30 @@ class LocationValidator:
                     self.state_locations[state] = set()
                 self.state_locations[state].add(loc_name.lower())
     
+    def _memoized(self, method: str, compute: Callable, location_name: str, coords: Optional[Dict]) -> Any:
+        """compute(location_name, coords), cached per (method, name, coords_signature)."""
+        if self.memo_size <= 0:
+            return compute(location_name, coords)
+        try:
+            key = (method, location_name, coords_signature(coords))
+            hash(key)
+        except TypeError:  # unhashable coordinate values
+            return compute(location_name, coords)
+        memo = self._memo
+        if key in memo:
+            memo.move_to_end(key)
+            self.memo_hits += 1
+            return memo[key]
+        self.memo_misses += 1
+        result = memo[key] = compute(location_name, coords)
+        if len(memo) > self.memo_size:
+            memo.popitem(last=False)
+        return result
+
+    def clear_memo(self) -> None:
+        """Drop memoized results (e.g. after changing the rule sets)."""
+        self._memo.clear()
+
     def is_valid_location(self, location_name: str, coords: Optional[Dict] = None) -> bool:
         """
         Validate if a location is plausible and Australian.
@@ -117,6 +201,9 @@ class LocationValidator:
         Returns:
             True if location passes validation, False otherwise
         """
+        return self._memoized('valid', self._is_valid_location, location_name, coords)
+
+    def _is_valid_location(self, location_name: str, coords: Optional[Dict]) -> bool:
         if not location_name:
             return False
         
@@ -166,6 +253,37 @@ class LocationValidator:
         
         return True
     
+    def filter_signature(self) -> Dict:
+        """Rule sets and code behind is_valid_location(), for keying stored results."""
+        return {
+            'rules': config_fingerprint({
+                'states': sorted(AUSTRALIAN_STATES),
+                'international': sorted(INTERNATIONAL_INDICATORS),
+                'implausible': sorted(IMPLAUSIBLE_PATTERNS),
+                'business': sorted(BUSINESS_INDICATORS),
+                'australia_bounds': AUSTRALIA_BOUNDS,
+                'state_bounds': STATE_BOUNDS,
+                'patterns': LOCATION_PATTERNS,
+                'suffixes': LOCATION_SUFFIXES,
+                'min_length': MIN_LOCATION_LENGTH,
+            }),
+            'code': code_fingerprint(
+                LocationValidator._is_valid_location,
+                LocationValidator._is_international,
+                LocationValidator._is_business_name,
+                LocationValidator._is_australia_coords,
+                LocationValidator._coords_match_state,
+                LocationValidator._matches_location_pattern,
+            ),
+        }
+
+    def confidence_signature(self) -> Dict:
+        """Thresholds and code behind validate_with_confidence()."""
+        return {
+            'thresholds': config_fingerprint(CONFIDENCE_THRESHOLDS),
+            'code': code_fingerprint(LocationValidator._validate_with_confidence),
+        }
+
     def validate_with_confidence(self, location_name: str, coords: Optional[Dict] = None) -> Dict:
         """
         Validate location and return confidence score with detailed reasoning.
@@ -175,8 +293,13 @@ class LocationValidator:
             coords: Optional coordinates dict
             
         Returns:
-            Dict with 'is_valid', 'confidence', and 'reasons' keys
+            Dict with 'is_valid', 'confidence', and 'reasons' keys (a fresh
+            copy, safe to modify)
         """
+        result = self._memoized('confidence', self._validate_with_confidence, location_name, coords)
+        return dict(result, reasons=list(result['reasons']))
+
+    def _validate_with_confidence(self, location_name: str, coords: Optional[Dict]) -> Dict:
         if not location_name:
             return {'is_valid': False, 'confidence': 0.0, 'reasons': ['Empty location name']}
         
@@ -276,19 +399,90 @@ class LocationValidator:
                 valid.append(loc)
         return valid
     
+    def validate_coords_batch(
+        self,
+        lats: Sequence,
+        lons: Sequence,
+        states: Optional[Sequence] = None,
+        types: Optional[Sequence] = None,
+    ) -> Dict[str, np.ndarray]:
+        """
+        The coordinate checks of is_valid_location()/validate_with_confidence()
+        for many points at once, as vectorized bounds tests. Results agree
+        with the per-dict checks, except that a None/NaN state counts as no
+        state here; the per-dict checks do not accept a None 'state' at all
+        (_coords_match_state raises AttributeError on it).
+
+        Nothing in the pipeline calls this yet: extraction validates each
+        (name, coords) pair through the memoized per-dict checks.
+
+        Args:
+            lats, lons: Coordinates (None/NaN = missing)
+            states: Optional claimed state codes (None/NaN = no state, unlike
+                the per-dict checks)
+            types: Optional location types
+
+        Returns:
+            Dict of arrays, one entry per point:
+              - in_australia : within Australia's bounds
+              - state_match  : within the claimed state's bounds (True if no
+                               state, an unknown state or missing coordinates)
+              - state_valid  : no state claimed, or a known state/territory
+              - is_valid     : every coordinate check of is_valid_location() passes
+              - confidence   : coordinate confidence as in validate_with_confidence()
+                               (state match, Australia bounds only, or 0.0)
+        """
+        lat = np.asarray(lats, dtype=float)
+        lon = np.asarray(lons, dtype=float)
+        n = len(lat)
+        a = AUSTRALIA_BOUNDS
+        in_australia = (lat >= a['lat_min']) & (lat <= a['lat_max']) & (lon >= a['lon_min']) & (lon <= a['lon_max'])
+
+        state_match = np.ones(n, dtype=bool)
+        state_valid = np.ones(n, dtype=bool)
+        if states is not None:
+            # Few distinct states: resolve each once, then gather per point
+            codes, uniques = pd.factorize(pd.Series(np.asarray(states, dtype=object)))
+            known = [str(s) in AUSTRALIAN_STATES for s in uniques]
+            bounds = np.array([
+                [b['lat_min'], b['lat_max'], b['lon_min'], b['lon_max']]
+                if b is not None else [-np.inf, np.inf, -np.inf, np.inf]
+                for b in (STATE_BOUNDS.get(str(s).upper()) for s in uniques)
+            ], dtype=float).reshape(-1, 4)
+            claimed = codes >= 0
+            state_valid[claimed] = np.asarray(known, dtype=bool)[codes[claimed]]
+            check = claimed & ~np.isnan(lat) & ~np.isnan(lon)
+            b = bounds[codes[check]]
+            state_match[check] = (
+                (b[:, 0] <= lat[check]) & (lat[check] <= b[:, 1])
+                & (b[:, 2] <= lon[check]) & (lon[check] <= b[:, 3])
+            )
+
+        international = np.zeros(n, dtype=bool)
+        if types is not None:
+            international = np.asarray(types, dtype=object) == 'international'
+
+        confidence = np.where(
+            in_australia,
+            np.where(state_match, CONFIDENCE_THRESHOLDS['state_coords_match'], CONFIDENCE_THRESHOLDS['australia_bounds']),
+            0.0,
+        )
+        confidence[~state_valid | international] = 0.0
+        return {
+            'in_australia': in_australia,
+            'state_match': state_match,
+            'state_valid': state_valid,
+            'is_valid': in_australia & state_match & state_valid & ~international,
+            'confidence': confidence,
+        }
+
     def _is_international(self, location_lower: str) -> bool:
         """Check if location name suggests international location."""
-        for intl_indicator in INTERNATIONAL_INDICATORS:
-            if intl_indicator in location_lower:
-                return True
-        return False
+        return self._international_re.search(location_lower) is not None
     
     def _is_business_name(self, location_lower: str) -> bool:
         """Check if location name contains business indicators."""
-        for business_indicator in BUSINESS_INDICATORS:
-            if business_indicator in location_lower:
-                return True
-        return False
+        return self._business_re.search(location_lower) is not None
     
     def _is_australia_coords(self, coords: Dict) -> bool:
         """
@@ -308,7 +502,8 @@ class LocationValidator:
             return False
         
         # Check if within Australia's approximate bounds
-        if -44 <= lat <= -10 and 113 <= lon <= 154:
+        bounds = AUSTRALIA_BOUNDS
+        if bounds['lat_min'] <= lat <= bounds['lat_max'] and bounds['lon_min'] <= lon <= bounds['lon_max']:
             return True
         
         return False
@@ -350,12 +545,9 @@ class LocationValidator:
         Returns:
             True if matches a valid location pattern
         """
-        import re
-        
         # Check against known location patterns
-        for pattern in LOCATION_PATTERNS:
-            if re.match(pattern, location_lower):
-                return True
+        if self._pattern_re.match(location_lower):
+            return True
         
         # Additional heuristics
         words = location_lower.split()
@@ -369,9 +561,4 @@ class LocationValidator:
             return True
         
         # Known location suffixes
-        location_suffixes = ['ton', 'ville', 'burg', 'field', 'hill', 'wood', 'brook', 'vale', 'bay', 'beach']
-        for suffix in location_suffixes:
-            if location_lower.endswith(suffix):
-                return True
-        
-        return False
+        return location_lower.endswith(LOCATION_SUFFIXES)
@@ -0,0 +1,101 @@
+"""
+Process-pool row engine for the extraction pipeline.
+
+Candidate extraction (Aho-Corasick, regex, spaCy, phonetic, ...) is pure CPU
+work, so it is fanned out to worker processes. Each worker builds its own
+EnsembleExtractionStrategy once in the pool initializer and reuses it for every
+chunk it receives. Geocoding stays in the parent process so that every lookup
+still goes through a single LocationCache.
+
+Usage:
+    with ParallelExtractionEngine(ensemble_kwargs, workers=8) as engine:
+        for records, locations in engine.imap(texts):
+            ...
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .ensemble_records import LocationRecord
+from .tier_stats import TierStats
+
+# EnsembleExtractionStrategy.extract_records() output for one row:
+# (LocationRecords, candidate locations); records pickle by location name
+RowExtraction = Tuple[List[LocationRecord], List[str]]
+
+# Per-process ensemble, built once by _init_worker
+_WORKER_ENSEMBLE = None
+
+
+def _init_worker(ensemble_kwargs: Dict) -> None:
+    """Pool initializer: build the ensemble and load every tier up front."""
+    global _WORKER_ENSEMBLE
+    from .strategies.extraction.ensemble_strategy import EnsembleExtractionStrategy
+
+    _WORKER_ENSEMBLE = EnsembleExtractionStrategy(**ensemble_kwargs)
+    _WORKER_ENSEMBLE._ensure_initialized()
+
+
+def _extract_chunk(texts: List[str]) -> Tuple[List[RowExtraction], Dict]:
+    """
+    Run the worker's ensemble over a chunk of texts (tiers batched), preserving
+    order. Also returns the chunk's tier stats, which are reset afterwards.
+    """
+    rows = _WORKER_ENSEMBLE.extract_records_batch(texts)
+    stats = _WORKER_ENSEMBLE.tier_stats
+    snapshot = stats.snapshot()
+    stats.reset()
+    return rows, snapshot
+
+
+class ParallelExtractionEngine:
+    """Fan ensemble extraction out to a pool of worker processes."""
+
+    def __init__(self, ensemble_kwargs: Dict, workers: int, chunk_size: int = 256):
+        if workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        self.ensemble_kwargs = ensemble_kwargs
+        self.workers = workers
+        self.chunk_size = max(1, chunk_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Tier stats of every chunk extracted so far, merged from the workers
+        self.tier_stats = TierStats()
+
+    def _ensure_started(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.ensemble_kwargs,),
+            )
+        return self._executor
+
+    def imap(self, texts: Sequence[str]) -> Iterator[RowExtraction]:
+        """
+        Yield one (records, locations) pair per text, in input order.
+
+        Chunks are submitted up front and consumed as they complete, so the
+        caller can geocode early rows while later chunks are still running.
+        """
+        texts = list(texts)
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        executor = self._ensure_started()
+        for chunk_results, chunk_stats in executor.map(_extract_chunk, chunks):
+            self.tier_stats.merge(chunk_stats)
+            yield from chunk_results
+
+    def extract(self, texts: Sequence[str]) -> List[RowExtraction]:
+        """Extract every text and return the results as a list in input order."""
+        return list(self.imap(texts))
+
+    def close(self) -> None:
+        """Shut the worker pool down."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ParallelExtractionEngine":
+        self._ensure_started()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,283 @@
+"""
+Streaming output sinks for pipeline results.
+
+Sinks accept result DataFrames chunk by chunk as the pipeline produces them,
+so no more than a chunk of rows is held in memory and the final write is not
+one large step at the end of the run.
+
+Supported formats (chosen by file extension in `open_sink`):
+  - .parquet : pyarrow ParquetWriter, one row group per chunk
+  - .csv     : appended chunks with a single header
+  - .jsonl   : one JSON record per line
+  - .xlsx    : openpyxl write-only (constant-memory) workbook
+
+Usage:
+    with open_sink("results.parquet", string_columns=["LINE_DESCR"]) as sink:
+        for chunk_df in chunks:
+            sink.write(chunk_df)
+"""
+import os
+import queue
+import threading
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Excel's hard row limit, including the header row
+EXCEL_MAX_ROWS = 1_048_576
+
+
+def _as_text(col: pd.Series) -> pd.Series:
+    """Convert a column to str, keeping missing values as None."""
+    return col.astype(object).where(col.notna(), None).map(lambda v: v if v is None else str(v))
+
+
+def _widen_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert float32 columns to float64 via their shortest decimal form, so
+    text formats show -33.8688 rather than the widened -33.86880111694336.
+    """
+    narrow = [c for c in df.columns if df[c].dtype == np.float32]
+    if not narrow:
+        return df
+    df = df.copy()
+    for col in narrow:
+        df[col] = df[col].astype(str).astype(np.float64)
+    return df
+
+
+class ResultSink:
+    """Base class: subclasses implement `_write` and optionally `_close`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows_written = 0
+        self._closed = False
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append one chunk of results."""
+        if self._closed:
+            raise ValueError(f"Sink for {self.path} is already closed")
+        if len(df) == 0 and self.rows_written > 0:
+            return
+        self._write(df)
+        self.rows_written += len(df)
+
+    def close(self) -> None:
+        """Flush and finalize the output file."""
+        if not self._closed:
+            self._closed = True
+            self._close()
+
+    def _write(self, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ResultSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class CsvSink(ResultSink):
+    """Append chunks to a CSV file, writing the header once."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._fh = open(path, "w", encoding="utf-8", newline="")
+
+    def _write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._fh, header=self.rows_written == 0, index=False)
+
+    def _close(self) -> None:
+        self._fh.close()
+
+
+class JsonlSink(ResultSink):
+    """Append chunks as JSON Lines (one record per row, NaN as null)."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._fh = open(path, "w", encoding="utf-8")
+
+    def _write(self, df: pd.DataFrame) -> None:
+        if len(df):
+            df = _widen_floats(df)
+            self._fh.write(df.to_json(orient="records", lines=True, force_ascii=False))
+            self._fh.write("\n")
+
+    def _close(self) -> None:
+        self._fh.close()
+
+
+class ParquetSink(ResultSink):
+    """
+    Write chunks as row groups of one Parquet file.
+
+    The schema is fixed by the first chunk. Object columns, and any column in
+    `string_columns`, are written as strings so that raw text columns whose
+    inferred dtype changes between chunks still match the schema.
+    """
+
+    def __init__(self, path: str, string_columns: Optional[Sequence[str]] = None):
+        super().__init__(path)
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+        except Exception as e:  # pragma: no cover
+            raise ImportError("pyarrow is required for Parquet output") from e
+        self._pa = pa
+        self._pq = pq
+        self._string_columns = set(string_columns or [])
+        self._schema = None
+        self._writer = None
+
+    def _prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        for col in df.columns:
+            # Categoricals are written as plain strings: their dictionary index
+            # width varies between chunks, while Parquet dictionary-encodes
+            # string columns on disk anyway
+            if (col in self._string_columns or df[col].dtype == object
+                    or isinstance(df[col].dtype, pd.CategoricalDtype)):
+                df[col] = _as_text(df[col])
+        return df
+
+    def _write(self, df: pd.DataFrame) -> None:
+        pa = self._pa
+        df = self._prepare(df)
+        if self._writer is None:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            # All-null columns in the first chunk would otherwise be typed "null"
+            fields = [
+                pa.field(f.name, pa.string()) if pa.types.is_null(f.type) else f
+                for f in table.schema
+            ]
+            self._schema = pa.schema(fields)
+            self._string_columns.update(f.name for f in fields if pa.types.is_string(f.type))
+            table = table.cast(self._schema)
+            self._writer = self._pq.ParquetWriter(self.path, self._schema)
+        else:
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ExcelSink(ResultSink):
+    """Stream rows into a write-only openpyxl workbook (constant memory)."""
+
+    def __init__(self, path: str, sheet_name: str = "Sheet1"):
+        super().__init__(path)
+        try:
+            from openpyxl import Workbook  # type: ignore
+        except Exception as e:  # pragma: no cover
+            raise ImportError("openpyxl is required for Excel output") from e
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet(sheet_name)
+        self._header_written = False
+
+    def _write(self, df: pd.DataFrame) -> None:
+        if self.rows_written + len(df) + 1 > EXCEL_MAX_ROWS:
+            raise ValueError(
+                f"Excel output is limited to {EXCEL_MAX_ROWS - 1} rows; "
+                f"write to .parquet or .csv instead"
+            )
+        if not self._header_written:
+            self._ws.append([str(c) for c in df.columns])
+            self._header_written = True
+        df = _widen_floats(df)
+        values = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+        for row in values:
+            self._ws.append([v.item() if isinstance(v, np.generic) else v for v in row])
+
+    def _close(self) -> None:
+        self._wb.save(self.path)
+
+
+class BackgroundSink(ResultSink):
+    """
+    Run another sink's writes on a background thread.
+
+    At most `max_pending` chunks are queued, so memory stays bounded while
+    extraction of the next chunk overlaps with writing the previous one.
+    Errors raised by the writer thread are re-raised on the next write/close.
+    """
+
+    def __init__(self, inner: ResultSink, max_pending: int = 2):
+        self.inner = inner
+        self.path = inner.path
+        self.rows_written = 0
+        self._closed = False
+        self._queue: "queue.Queue[Optional[pd.DataFrame]]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="result-sink", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            df = self._queue.get()
+            if df is None:
+                return
+            if self._error is None:
+                try:
+                    self.inner.write(df)
+                except BaseException as e:  # noqa: BLE001 - surfaced to caller
+                    self._error = e
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _write(self, df: pd.DataFrame) -> None:
+        self._raise_pending()
+        self._queue.put(df)
+
+    def _close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+        self.inner.close()
+        self._raise_pending()
+
+
+SINK_TYPES = {
+    ".parquet": ParquetSink,
+    ".pq": ParquetSink,
+    ".csv": CsvSink,
+    ".jsonl": JsonlSink,
+    ".xlsx": ExcelSink,
+}
+
+
+def open_sink(
+    path: str,
+    string_columns: Optional[Sequence[str]] = None,
+    background: bool = True,
+) -> ResultSink:
+    """
+    Open the sink matching `path`'s extension.
+
+    Args:
+        path: Output file (.parquet, .csv, .jsonl or .xlsx)
+        string_columns: Columns to always write as strings (Parquet only)
+        background: Write chunks on a background thread
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in SINK_TYPES:
+        raise ValueError(
+            f"Unsupported output format '{ext}' for {path}. "
+            f"Expected one of: {sorted(SINK_TYPES)}"
+        )
+    if SINK_TYPES[ext] is ParquetSink:
+        sink: ResultSink = ParquetSink(path, string_columns=string_columns)
+    else:
+        sink = SINK_TYPES[ext](path)
+    return BackgroundSink(sink) if background else sink
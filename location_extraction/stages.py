@@ -0,0 +1,130 @@
+"""
+Persisted pipeline stages for feature-only re-runs.
+
+process_file runs each input chunk through four stages, and with a stage
+directory configured each stage's output is stored as one Parquet part per
+chunk:
+
+  text       : combined text per row
+  candidates : ensemble_* fields + candidate list per extracted text
+  resolved   : cache/geocoding/validity-filter result per extracted text
+  features   : all feature columns per extracted text
+
+  <stage_dir>/<stage>-<key>/part-<first row>.parquet
+
+Each stage's key hashes the key of the stage before it plus that stage's own
+settings (see make_stage_keys), so changing e.g. the reference location only
+changes the features key: a re-run loads the stored resolutions and computes
+the features again, without running spaCy or the geocoder. Parts also store
+the texts they were computed for and are only used if those match.
+
+Resolutions reflect the location cache as it was when they were stored; only
+changes to the manual overrides invalidate them.
+"""
+import json
+import os
+from typing import Dict, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from .fingerprint import config_fingerprint
+
+STAGES = ("text", "candidates", "resolved", "features")
+
+
+def make_stage_keys(input_key: str, settings: Mapping[str, Mapping]) -> Dict[str, str]:
+    """Chain `input_key` through the per-stage `settings` into one key per stage."""
+    keys: Dict[str, str] = {}
+    upstream = input_key
+    for stage in STAGES:
+        upstream = keys[stage] = config_fingerprint({
+            "upstream": upstream,
+            "stage": stage,
+            "settings": settings.get(stage, {}),
+        })
+    return keys
+
+
+def resolution_to_frame(resolution: Mapping[str, Sequence]) -> pd.DataFrame:
+    """LocationExtractor.resolve_batch() output as a storable DataFrame."""
+    return pd.DataFrame({
+        "extracted": list(resolution["extracted"]),
+        "geocoded": list(resolution["geocoded"]),
+        "primary": list(resolution["primary"]),
+        # Coordinate dicts vary in keys by source (database, cache, geocoder),
+        # so they are kept as JSON text (floats round-trip exactly)
+        "coords": [
+            json.dumps(c, sort_keys=True, default=str) if c is not None else None
+            for c in resolution["coords"]
+        ],
+    })
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow  # type: ignore  # noqa: F401
+    except Exception as e:  # pragma: no cover
+        raise ImportError("pyarrow is required for persisted stages (--stage-dir)") from e
+
+
+def _as_list(value) -> Optional[List]:
+    return None if value is None else list(value)
+
+
+def resolution_from_frame(df: pd.DataFrame) -> Dict[str, List]:
+    """Inverse of resolution_to_frame()."""
+    return {
+        "extracted": [_as_list(v) for v in df["extracted"]],
+        "geocoded": [_as_list(v) for v in df["geocoded"]],
+        "primary": [str(v) for v in df["primary"]],
+        "coords": [json.loads(v) if v is not None else None for v in df["coords"]],
+    }
+
+
+class StageStore:
+    """
+    Stage outputs for one input file under one set of stage keys.
+
+    Usage:
+        store = StageStore("out.stages", make_stage_keys(input_key, settings))
+        df = store.load("resolved", row_offset, texts)   # None if not stored
+        store.save("resolved", row_offset, df, texts)
+    """
+
+    def __init__(self, directory: str, keys: Mapping[str, str]):
+        _require_pyarrow()
+        self.directory = directory
+        self.keys = dict(keys)
+
+    def path(self, stage: str, part: int) -> str:
+        return os.path.join(self.directory, f"{stage}-{self.keys[stage]}", f"part-{part:010d}.parquet")
+
+    def load(self, stage: str, part: int, texts: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+        """
+        A stored part, or None if missing/unreadable or (when `texts` is
+        given) stored for different texts.
+        """
+        path = self.path(stage, part)
+        if not os.path.exists(path):
+            return None
+        try:
+            df = pd.read_parquet(path)
+        except Exception:
+            return None
+        if texts is not None:
+            if "text" not in df.columns or df["text"].tolist() != list(texts):
+                return None
+            df = df.drop(columns="text")
+        return df
+
+    def save(self, stage: str, part: int, df: pd.DataFrame, texts: Optional[Sequence[str]] = None) -> None:
+        """Store a part (written to a temp file and renamed into place)."""
+        _require_pyarrow()
+        path = self.path(stage, part)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if texts is not None:
+            df = df.copy()
+            df.insert(0, "text", list(texts))
+        tmp = path + ".tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
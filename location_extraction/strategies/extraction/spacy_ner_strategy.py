@@ -1,6 +1,6 @@
 import re
 import importlib.util
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Sequence, Set, Any
 
 from ..base import BaseModel, PrivateAttr
 from .country_detector import CountryDetector
@@ -118,29 +118,20 @@ class SpacyNerStrategy(BaseModel):  # type: ignore[misc]
                     pass
         return cand
 
-    def extract(self, text: str) -> List[str]:
-        if not text or self._nlp is None:
-            return []
-        nlp = self._nlp
-        doc = nlp(text)
-        cand = self._extract_from_doc(doc)
-
-        if len(cand) < 2:
-            norm = self._normalize_text(text)
-            if norm != text:
-                try:
-                    cand2 = self._extract_from_doc(nlp(norm))
-                    seen: Set[str] = set()
-                    merged: List[str] = []
-                    for w in cand + cand2:
-                        lw = w.lower()
-                        if lw not in seen:
-                            seen.add(lw)
-                            merged.append(w)
-                    cand = merged
-                except Exception:
-                    pass
+    @staticmethod
+    def _merge_candidates(first: List[str], second: List[str]) -> List[str]:
+        """Concatenate candidate lists, dropping case-insensitive duplicates."""
+        seen: Set[str] = set()
+        merged: List[str] = []
+        for w in first + second:
+            lw = w.lower()
+            if lw not in seen:
+                seen.add(lw)
+                merged.append(w)
+        return merged
 
+    def _finish(self, text: str, cand: List[str]) -> List[str]:
+        """Country fallback and gazetteer filtering for one text's candidates."""
         if self._country is not None and not cand:
             try:
                 code = self._country.detect_country(text)
@@ -157,4 +148,63 @@ class SpacyNerStrategy(BaseModel):  # type: ignore[misc]
             tokens = {t.lower() for t in re.findall(r"[\w'-]+", text)}
             names = tokens
         matches = names.intersection(keys)
-        return list(matches)
\ No newline at end of file
+        return list(matches)
+
+    def extract(self, text: str) -> List[str]:
+        if not text or self._nlp is None:
+            return []
+        nlp = self._nlp
+        doc = nlp(text)
+        cand = self._extract_from_doc(doc)
+
+        if len(cand) < 2:
+            norm = self._normalize_text(text)
+            if norm != text:
+                try:
+                    cand = self._merge_candidates(cand, self._extract_from_doc(nlp(norm)))
+                except Exception:
+                    pass
+
+        return self._finish(text, cand)
+
+    def extract_batch(self, texts: Sequence[str], batch_size: int = 64) -> List[List[str]]:
+        """
+        extract() over many texts, streaming them through `nlp.pipe` so spaCy
+        can batch the model work. Returns one result list per input text.
+        """
+        out: List[List[str]] = [[] for _ in texts]
+        if self._nlp is None:
+            return out
+        nlp = self._nlp
+        idx = [i for i, t in enumerate(texts) if t]
+        cands = {
+            i: self._extract_from_doc(doc)
+            for i, doc in zip(idx, nlp.pipe([texts[i] for i in idx], batch_size=batch_size))
+        }
+
+        # Second pass over title-cased variants, only where extract() would do one
+        retry = []
+        for i in idx:
+            if len(cands[i]) < 2:
+                norm = self._normalize_text(texts[i])
+                if norm != texts[i]:
+                    retry.append((i, norm))
+        try:
+            docs = list(nlp.pipe([norm for _, norm in retry], batch_size=batch_size))
+        except Exception:
+            docs = []
+            for _, norm in retry:
+                try:
+                    docs.append(nlp(norm))
+                except Exception:
+                    docs.append(None)
+        for (i, _), doc in zip(retry, docs):
+            if doc is not None:
+                try:
+                    cands[i] = self._merge_candidates(cands[i], self._extract_from_doc(doc))
+                except Exception:
+                    pass
+
+        for i in idx:
+            out[i] = self._finish(texts[i], cands[i])
+        return out
@@ -1,4 +1,4 @@
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 from ..base import BaseModel, PrivateAttr
 
@@ -51,4 +51,19 @@ class VectorSpaceGazetteerStrategy(BaseModel):  # type: ignore[misc]
         sims = cosine_similarity(self._matrix, Xq).ravel()  # type: ignore[union-attr]
         names = self._names or []
         hits = [names[i] for i, s in enumerate(sims) if s >= self.threshold]
-        return list({h.lower() for h in hits})
\ No newline at end of file
+        return list({h.lower() for h in hits})
+
+    def extract_batch(self, texts: Sequence[str]) -> List[List[str]]:
+        """extract() over many texts with one transform and one similarity matrix."""
+        out: List[List[str]] = [[] for _ in texts]
+        idx = [i for i, t in enumerate(texts) if t]
+        if not idx:
+            return out
+        from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
+        Xq = self._vectorizer.transform([texts[i] for i in idx])  # type: ignore[union-attr]
+        sims = cosine_similarity(self._matrix, Xq)  # type: ignore[union-attr]
+        names = self._names or []
+        for col, i in enumerate(idx):
+            hits = [names[j] for j in (sims[:, col] >= self.threshold).nonzero()[0]]
+            out[i] = list({h.lower() for h in hits})
+        return out
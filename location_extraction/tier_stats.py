@@ -0,0 +1,244 @@
+"""
+Per-tier cost and yield counters for EnsembleExtractionStrategy.
+
+For each tier (aho_corasick, regex, spacy, phonetic, tfidf, bow, country):
+
+  - calls       : texts the tier was run on
+  - seconds     : total time spent in the tier
+  - p50/p95/p99 : per-text latency percentiles, over texts timed on their
+                  own (None when there are none)
+  - batched     : texts run in a batch (spaCy, TF-IDF/BoW extract_batch);
+                  they count towards calls and seconds, but a batch gives no
+                  per-text latency, so they are left out of the percentiles
+  - exceptions  : failures swallowed by the ensemble
+  - locations   : matches produced
+  - unique      : locations in a returned result found by this tier alone
+
+Latencies go into a fixed log-scale histogram (~9% wide buckets), so
+recording is O(1) and snapshots from worker processes can simply be added
+together with merge().
+
+Counters can be saved and loaded as JSON so they accumulate across runs,
+and plan_tiers() turns them into a skip/run decision per tier from its
+unique-hit rate per millisecond.
+
+Usage:
+    stats = TierStats()
+    stats.record("spacy", 0.004, rows=1, locations=2)
+    stats.summary()["spacy"]["p95_ms"]
+"""
+import json
+import math
+import os
+import threading
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Histogram bucket i holds latencies in [_RATIO**i, _RATIO**(i+1)) microseconds
+_RATIO = 2 ** 0.125
+_BUCKETS = 288  # up to ~2**36 us (19 hours)
+_LOG_RATIO = math.log(_RATIO)
+
+COUNTERS = ("calls", "seconds", "exceptions", "locations", "unique", "batched")
+
+
+def _bucket(seconds: float) -> int:
+    us = seconds * 1e6
+    if us < 1.0:
+        return 0
+    return min(int(math.log(us) / _LOG_RATIO), _BUCKETS - 1)
+
+
+def _new_tier() -> Dict:
+    tier: Dict = {name: 0 for name in COUNTERS}
+    tier["seconds"] = 0.0
+    tier["histogram"] = [0] * _BUCKETS
+    return tier
+
+
+class TierStats:
+    """Thread-safe per-tier counters (see module docstring)."""
+
+    def __init__(self):
+        self._tiers: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _tier(self, name: str) -> Dict:
+        tier = self._tiers.get(name)
+        if tier is None:
+            tier = self._tiers[name] = _new_tier()
+        return tier
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        rows: int = 1,
+        locations: int = 0,
+        exceptions: int = 0,
+        batched: bool = False,
+    ) -> None:
+        """
+        Count one run of tier `name` over `rows` texts taking `seconds` in total.
+        Only unbatched single-text runs go into the latency histogram.
+        """
+        if rows <= 0:
+            return
+        with self._lock:
+            tier = self._tier(name)
+            tier["calls"] += rows
+            tier["seconds"] += seconds
+            tier["locations"] += locations
+            tier["exceptions"] += exceptions
+            if batched or rows > 1:
+                tier["batched"] += rows
+            else:
+                tier["histogram"][_bucket(seconds)] += 1
+
+    def record_exception(self, name: str) -> None:
+        with self._lock:
+            self._tier(name)["exceptions"] += 1
+
+    def record_unique(self, results: Mapping[str, Mapping]) -> None:
+        """Credit single-source locations of merged results (location -> sources)."""
+        with self._lock:
+            for sources in results.values():
+                if len(sources) == 1:
+                    self._tier(next(iter(sources)))["unique"] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Raw counters (picklable/JSON-able), e.g. to send from a worker process."""
+        with self._lock:
+            return {name: dict(tier, histogram=list(tier["histogram"])) for name, tier in self._tiers.items()}
+
+    def merge(self, snapshot: Mapping[str, Mapping]) -> None:
+        """Add the counters of another snapshot() into these."""
+        with self._lock:
+            for name, other in snapshot.items():
+                tier = self._tier(name)
+                for counter in COUNTERS:
+                    tier[counter] += other.get(counter, 0)
+                histogram = tier["histogram"]
+                for i, count in enumerate(other.get("histogram", ())):
+                    histogram[i] += count
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tiers = {}
+
+    def mean_ms(self) -> Dict[str, Tuple[int, float]]:
+        """(calls, mean latency in ms) per tier; cheaper than summary()."""
+        with self._lock:
+            return {
+                name: (tier["calls"], 1000.0 * tier["seconds"] / tier["calls"] if tier["calls"] else 0.0)
+                for name, tier in self._tiers.items()
+            }
+
+    @staticmethod
+    def _percentile(histogram: List[int], total: int, q: float) -> Optional[float]:
+        """Upper edge (ms) of the bucket holding the q-quantile (None if nothing was timed)."""
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(histogram):
+            seen += count
+            if seen >= rank:
+                return _RATIO ** (i + 1) / 1000.0
+        return _RATIO ** len(histogram) / 1000.0
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        Per-tier calls, time, latency percentiles (ms; None for tiers only run
+        in batches), exceptions and yield.
+        """
+        out: Dict[str, Dict] = {}
+        for name, tier in self.snapshot().items():
+            calls = tier["calls"]
+            timed = sum(tier["histogram"])
+            percentiles = {
+                f"p{round(100 * q)}_ms": self._percentile(tier["histogram"], timed, q) for q in (0.50, 0.95, 0.99)
+            }
+            out[name] = {
+                "calls": calls,
+                "batched": tier["batched"],
+                "seconds": round(tier["seconds"], 4),
+                "mean_ms": round(1000.0 * tier["seconds"] / calls, 4) if calls else 0.0,
+                **{key: None if ms is None else round(ms, 4) for key, ms in percentiles.items()},
+                "exceptions": tier["exceptions"],
+                "locations": tier["locations"],
+                "unique": tier["unique"],
+            }
+        return out
+
+    def save(self, path: str) -> None:
+        """Write snapshot() as JSON (temp file + rename)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "TierStats":
+        """Stats saved by save(); empty if the file is missing or unreadable."""
+        stats = cls()
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    stats.merge(json.load(f))
+            except (json.JSONDecodeError, OSError, AttributeError, TypeError):
+                pass
+        return stats
+
+
+def plan_tiers(
+    summary: Mapping[str, Mapping],
+    min_yield_per_ms: float,
+    min_calls: int = 200,
+    protected: Sequence[str] = ("aho_corasick",),
+) -> List[Dict]:
+    """
+    Decide which tiers to run from TierStats.summary() output.
+
+    A tier's yield is its unique contributions per call, and its value is
+    that yield per millisecond of mean latency. Tiers with at least
+    `min_calls` observed calls whose value is below `min_yield_per_ms` are
+    skipped, except `protected` ones and country detection. Tiers with too
+    few calls always run (their value is not known yet).
+
+    Skipping a tier also changes scoring: its matches no longer add their
+    source weight or agreement bonus to confidence, nor appear in sources.
+    Skipped tiers are still probed on a sample of texts (see
+    EnsembleExtractionStrategy.skipped_tier_probe_every), so their counters
+    keep updating and a later plan can run them again.
+
+    Returns one decision dict per tier, best value first:
+    tier, calls, mean_ms, unique_rate, yield_per_ms, action ('run'/'skip'), reason.
+    """
+    decisions = []
+    for tier, stats in summary.items():
+        calls = stats.get("calls", 0)
+        mean_ms = stats.get("mean_ms", 0.0)
+        unique_rate = stats.get("unique", 0) / calls if calls else 0.0
+        yield_per_ms = unique_rate / max(mean_ms, 1e-6) if calls else float("inf")
+        if tier in protected or tier == "country":
+            action, reason = "run", "protected"
+        elif calls < min_calls:
+            action, reason = "run", f"only {calls} calls observed"
+        elif yield_per_ms < min_yield_per_ms:
+            action, reason = "skip", f"{yield_per_ms:.4g} unique hits/ms < {min_yield_per_ms:g}"
+        else:
+            action, reason = "run", f"{yield_per_ms:.4g} unique hits/ms"
+        decisions.append({
+            "tier": tier,
+            "calls": calls,
+            "mean_ms": mean_ms,
+            "unique_rate": round(unique_rate, 6),
+            "yield_per_ms": yield_per_ms,
+            "action": action,
+            "reason": reason,
+        })
+    decisions.sort(key=lambda d: -d["yield_per_ms"])
+    return decisions
@@ -11,13 +11,22 @@ Usage:
     python main.py --output results.xlsx        # Specify output file
     python main.py --demo                       # Run demo with sample data
     python main.py --benchmark                  # Run benchmark comparison
+    python main.py --benchmark --tier-threads 4 # ... plus serial vs concurrent tiers
     python main.py --no-cache                   # Disable location caching
+    python main.py --workers 8                  # Extract with 8 worker processes
+    python main.py --resume                     # Continue an interrupted run
+    python main.py --reuse-from prev.parquet    # Only re-extract changed rows
+    python main.py --stage-dir data/stages      # Keep stages; re-runs redo only what changed
+    python main.py --adaptive-tiers             # Skip tiers with too few unique hits per ms
+    python main.py --reference melbourne=-37.8136,144.9631,VIC --reference-column OFFICE
 """
 
 import argparse
+import itertools
+import os
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import numpy as np
 import pandas as pd
@@ -33,6 +42,16 @@ from location_extraction import (
     NominatimGeocodingStrategy,
     GoogleSearchGeocodingStrategy,
 )
+from location_extraction.checkpoint import RunCheckpoint
+from location_extraction.ensemble_records import LocationRecord, source_label
+from location_extraction.feature_calculator import REFERENCE_FEATURES, reference_feature_name, reference_key
+from location_extraction.feature_columns import FeatureColumns, feature_schema
+from location_extraction.fingerprint import PriorResults, config_fingerprint, text_fingerprint
+from location_extraction.parallel import ParallelExtractionEngine
+from location_extraction.readers import ChunkedTableReader
+from location_extraction.sinks import open_sink
+from location_extraction.stages import STAGES, StageStore, make_stage_keys, resolution_from_frame, resolution_to_frame
+from location_extraction.tier_stats import TierStats, plan_tiers
 from location_extraction.strategies.extraction.ensemble_strategy import EnsembleExtractionStrategy
 
 # =============================================================================
@@ -55,7 +74,16 @@ DEFAULT_CONFIG = {
         "lat": -33.8688,
         "lon": 151.2093,
         "name": "Sydney CBD",
+        "state": "NSW",
     },
+    # Extra named reference points; each adds distance_from_<name>_km,
+    # travel_category_<name>, ... columns, e.g.
+    #   {"melbourne": {"lat": -37.8136, "lon": 144.9631, "state": "VIC"}}
+    "reference_locations": {},
+    # Optional input column naming each row's reference point (one of
+    # reference_locations); those rows get that point's features in the
+    # main distance/travel columns
+    "reference_column": None,
     # Ensemble strategy settings
     "enable_aho_corasick": True,
     "enable_regex": True,
@@ -66,6 +94,44 @@ DEFAULT_CONFIG = {
     # Geocoding settings
     "enable_online_geocoding": True,
     "enable_cache": True,
+    # Parallelism settings (1 = serial, in-process extraction)
+    "workers": 1,
+    "worker_chunk_size": 256,
+    # Threads per ensemble for running independent tiers concurrently (0 = serial)
+    "tier_threads": 0,
+    # Ensemble results memoized per normalized text (None = ensemble default)
+    "ensemble_memo_size": None,
+    # Ensemble results kept across runs, so texts seen before skip extraction
+    # (default: <cache_dir>/extraction_store.sqlite while caching is enabled)
+    # The store keeps at most extraction_store_max_entries results (None =
+    # ensemble default, ~1M), pruning the oldest; delete the file to clear it
+    "enable_extraction_store": True,
+    "extraction_store": None,
+    "extraction_store_max_entries": None,
+    # Collapse duplicate combined texts before extraction
+    "dedup": True,
+    # Rows per streamed input chunk
+    "chunk_size": 10000,
+    # Checkpoint finished chunks + cache every N chunks (for --resume)
+    "enable_checkpoint": True,
+    "checkpoint_every": 1,
+    "checkpoint_dir": None,  # default: <output_file>.checkpoint
+    # Prior output files whose rows (matched by row_fingerprint) are reused
+    "reuse_from": [],
+    # Directory for persisted pipeline stages (text, candidates, resolved,
+    # features); None disables them. See location_extraction.stages
+    "stage_dir": None,
+    # Tier stats accumulated across runs (default: <cache_dir>/tier_stats.json
+    # while caching is enabled)
+    "tier_stats_file": None,
+    # Skip tiers whose unique hits per ms (from those stats) fall below
+    # adaptive_min_yield_per_ms. See location_extraction.tier_stats.plan_tiers
+    "adaptive_tiers": False,
+    "adaptive_min_yield_per_ms": 0.01,
+    "adaptive_min_calls": 200,
+    # Every Nth extracted text still runs the skipped tiers (results discarded)
+    # so their stats keep updating (None = ensemble default, 0 = never)
+    "adaptive_probe_every": None,
 }
 
 
@@ -79,16 +145,167 @@ def combine_text_columns(df: pd.DataFrame, columns: List[str], sep: str = " | ")
     if not available_cols:
         raise ValueError(f"None of the columns {columns} found in dataframe")
 
-    def join_row(row):
-        parts = [str(v).strip() for v in row if pd.notna(v) and str(v).strip()]
-        return sep.join(parts)
+    # Column-at-a-time over object arrays: only non-missing cells are
+    # stringified/stripped, and separators are added with boolean masks
+    # instead of calling a Python function per row
+    n = len(df)
+    combined = np.full(n, "", dtype=object)
+    for col in available_cols:
+        values = df[col].to_numpy(dtype=object)
+        present = pd.notna(values)
+        text = np.full(n, "", dtype=object)
+        text[present] = [str(v).strip() for v in values[present]]
+        keep = text != ""
+        combined[keep & (combined != "")] += sep
+        combined[keep] += text[keep]
+    return pd.Series(combined, index=df.index)
+
+
+def _accumulate_run_stats(run_stats: Dict, chunk_stats: Dict) -> None:
+    """Add one chunk's extraction stats into the running totals for a file."""
+    for key in ("total_rows", "unique_texts", "reused_texts", "extraction_seconds", "est_seconds_saved"):
+        run_stats[key] = run_stats.get(key, 0) + chunk_stats.get(key, 0)
+    for stage in chunk_stats.get("stages_loaded", ()):
+        loaded = run_stats.setdefault("stages_loaded", {})
+        loaded[stage] = loaded.get(stage, 0) + 1
+    total = run_stats.get("total_rows", 0)
+    run_stats["dedup_ratio"] = 1 - run_stats.get("unique_texts", 0) / total if total else 0.0
+
+
+def _accumulate_summary(summary: Dict, chunk_df: pd.DataFrame) -> int:
+    """Add one result chunk to the running run summary; returns rows with a location."""
+    found = int(chunk_df["locations_found"].gt(0).sum()) if len(chunk_df) else 0
+    summary["total_rows"] += len(chunk_df)
+    summary["found"] += found
+    if "is_valid_location" in chunk_df.columns:
+        summary["validated"] += int(chunk_df["is_valid_location"].sum())
+    if "travel_category" in chunk_df.columns:
+        categories = summary["categories"]
+        for cat, count in chunk_df["travel_category"].value_counts().items():
+            if not count:
+                continue
+            categories[cat] = categories.get(cat, 0) + int(count)
+    return found
+
+
+def _checkpoint_settings(config: Dict) -> Dict:
+    """Config values that change the output; a checkpoint only resumes if they match."""
+    settings = {
+        k: v for k, v in ensemble_kwargs_from_config(config).items() if k not in (
+            "locations_db", "tier_threads", "memo_size", "result_store", "result_store_max_entries",
+            "skipped_tier_probe_every",
+        )
+    }
+    settings.update({
+        "reference_location": config.get("reference_location"),
+        "reference_locations": config.get("reference_locations"),
+        "reference_column": config.get("reference_column"),
+        "enable_online_geocoding": config.get("enable_online_geocoding", True),
+        "chunk_size": config.get("chunk_size", 10000),
+    })
+    return settings
+
+
+def _write_checkpoint(checkpoint: RunCheckpoint, parts: List, location_cache: Optional[LocationCache]) -> None:
+    """Persist finished chunks, then the cache, so resumed runs never redo geocoding."""
+    for chunk_df, chunk_stats in parts:
+        checkpoint.record_chunk(chunk_df, int(chunk_df["row_index"].iloc[0]), chunk_stats)
+    if location_cache is not None:
+        location_cache.save()
+
+
+def print_tier_stats(tier_stats: Dict[str, Dict]) -> None:
+    """Print EnsembleExtractionStrategy.get_tier_stats() as a table."""
+    def ms(value: Optional[float]) -> str:
+        return "n/a" if value is None else f"{value:.3f}"
+
+    print("\nEnsemble Tier Statistics:")
+    print(f"  {'tier':<13}{'calls':>9}{'batched':>9}{'total s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'errors':>8}{'found':>9}{'unique':>8}")
+    for tier, stats in tier_stats.items():
+        print(f"  {tier:<13}{stats['calls']:>9}{stats.get('batched', 0):>9}{stats['seconds']:>10.2f}"
+              f"{ms(stats['p50_ms']):>9}{ms(stats['p95_ms']):>9}{ms(stats['p99_ms']):>9}{stats['exceptions']:>8}"
+              f"{stats['locations']:>9}{stats['unique']:>8}")
+    if any(stats.get("batched") for stats in tier_stats.values()):
+        print("  (percentiles cover texts run one at a time; batched texts only count towards total s)")
 
-    return df[available_cols].apply(join_row, axis=1)
+
+def print_tier_plan(decisions: List[Dict]) -> None:
+    """Print tier_stats.plan_tiers() decisions as a table."""
+    print("\nAdaptive Tier Plan:")
+    if not decisions:
+        print("  no tier stats from earlier runs yet; every tier runs")
+        return
+    print(f"  {'tier':<13}{'calls':>9}{'mean ms':>10}{'unique/call':>13}  action  reason")
+    for d in decisions:
+        print(f"  {d['tier']:<13}{d['calls']:>9}{d['mean_ms']:>10.3f}{d['unique_rate']:>13.4f}"
+              f"  {d['action']:<6}  {d['reason']}")
+    skipped = [d["tier"] for d in decisions if d["action"] == "skip"]
+    if skipped:
+        print(f"  note: skipping {', '.join(skipped)} changes ensemble_confidence and ensemble_sources "
+              f"wherever they matched (source weight and agreement bonus)")
+
+
+def tier_stats_path(config: Dict) -> Optional[str]:
+    """Where tier stats persist between runs, or None if they are not kept."""
+    if config.get("tier_stats_file"):
+        return config["tier_stats_file"]
+    if config.get("enable_cache", True):
+        return os.path.join(config.get("cache_dir", "data"), "tier_stats.json")
+    return None
+
+
+def extraction_store_path(config: Dict) -> Optional[str]:
+    """The ensemble's cross-run result store, or None if it is disabled."""
+    if not config.get("enable_extraction_store", True):
+        return None
+    if config.get("extraction_store"):
+        return config["extraction_store"]
+    if config.get("enable_cache", True):
+        return os.path.join(config.get("cache_dir", "data"), "extraction_store.sqlite")
+    return None
+
+
+def feature_config_fingerprint(ensemble_strategy: EnsembleExtractionStrategy, config: Dict) -> str:
+    """Fingerprint of everything that determines a row's features (see row_fingerprint)."""
+    settings = dict(ensemble_strategy.config_signature())
+    settings["reference_location"] = config.get("reference_location")
+    settings["reference_locations"] = config.get("reference_locations") or {}
+    settings["enable_online_geocoding"] = config.get("enable_online_geocoding", False)
+    return config_fingerprint(settings)
+
+
+def ensemble_kwargs_from_config(config: Dict) -> Dict:
+    """Build EnsembleExtractionStrategy keyword arguments from a pipeline config."""
+    kwargs = {
+        "locations_db": AUSTRALIAN_LOCATIONS,
+        "enable_aho_corasick": config.get("enable_aho_corasick", True),
+        "enable_regex": config.get("enable_regex", True),
+        "enable_spacy": config.get("enable_spacy", True),
+        "enable_phonetic": config.get("enable_phonetic", True),
+        "enable_tfidf": config.get("enable_tfidf", False),
+        "enable_bow": config.get("enable_bow", False),
+    }
+    if config.get("skip_tiers"):
+        kwargs["skip_tiers"] = sorted(config["skip_tiers"])
+    if config.get("tier_threads"):
+        kwargs["tier_threads"] = int(config["tier_threads"])
+    if config.get("adaptive_probe_every") is not None:
+        kwargs["skipped_tier_probe_every"] = int(config["adaptive_probe_every"])
+    if config.get("ensemble_memo_size") is not None:
+        kwargs["memo_size"] = int(config["ensemble_memo_size"])
+    store_path = extraction_store_path(config)
+    if store_path:
+        kwargs["result_store"] = store_path
+        if config.get("extraction_store_max_entries") is not None:
+            kwargs["result_store_max_entries"] = int(config["extraction_store_max_entries"])
+    return kwargs
 
 
 def create_ensemble_extractor(
     config: Dict,
     location_cache: Optional[LocationCache] = None,
+    ensemble_strategy: Optional[EnsembleExtractionStrategy] = None,
 ) -> LocationExtractor:
     """
     Create a LocationExtractor with EnsembleExtractionStrategy.
@@ -97,17 +314,13 @@ def create_ensemble_extractor(
     - EnsembleExtractionStrategy for intelligent multi-tier extraction
     - LocationExtractor for geocoding and feature calculation
     - LocationCache for persistent caching
+
+    Pass `ensemble_strategy` to share an existing ensemble (and its loaded
+    spaCy model and indexes) instead of building a second one.
     """
     # Create ensemble extraction strategy
-    ensemble_strategy = EnsembleExtractionStrategy(
-        locations_db=AUSTRALIAN_LOCATIONS,
-        enable_aho_corasick=config.get("enable_aho_corasick", True),
-        enable_regex=config.get("enable_regex", True),
-        enable_spacy=config.get("enable_spacy", True),
-        enable_phonetic=config.get("enable_phonetic", True),
-        enable_tfidf=config.get("enable_tfidf", False),
-        enable_bow=config.get("enable_bow", False),
-    )
+    if ensemble_strategy is None:
+        ensemble_strategy = EnsembleExtractionStrategy(**ensemble_kwargs_from_config(config))
 
     # Create geocoding strategy (chained: Google Search refinement -> Nominatim)
     geocoding_strategy = None
@@ -120,6 +333,7 @@ def create_ensemble_extractor(
     # Create the extractor
     extractor = LocationExtractor(
         reference_location=config.get("reference_location", DEFAULT_CONFIG["reference_location"]),
+        reference_locations=config.get("reference_locations"),
         strategy=ensemble_strategy,
         geocoding_strategy=geocoding_strategy,
         location_cache=location_cache,
@@ -128,6 +342,66 @@ def create_ensemble_extractor(
     return extractor
 
 
+def ensemble_columns(records_per_text: Sequence[Sequence[LocationRecord]]) -> Dict[str, List]:
+    """
+    Render the ensemble_* result columns from extract_records() output, one
+    value per text. This is the only place their strings are built.
+    """
+    location, confidence, sources, in_database, all_locations, num_locations = [], [], [], [], [], []
+    for records in records_per_text:
+        if records:
+            best = records[0]
+            location.append(best.location)
+            confidence.append(best.confidence)
+            sources.append(source_label(best.sources))
+            in_database.append(best.in_database)
+            all_locations.append(", ".join([record.location for record in records]))
+            num_locations.append(len(records))
+        else:
+            location.append(None)
+            confidence.append(0.0)
+            sources.append("")
+            in_database.append(False)
+            all_locations.append("")
+            num_locations.append(0)
+    return {
+        "ensemble_location": location,
+        "ensemble_confidence": confidence,
+        "ensemble_sources": sources,
+        "ensemble_in_database": in_database,
+        "ensemble_all_locations": all_locations,
+        "ensemble_num_locations": num_locations,
+    }
+
+
+def select_row_references(results_df: pd.DataFrame, choice: pd.Series, reference_keys: List[str]) -> None:
+    """
+    Per-row reference points: rows whose `choice` names one of the extra
+    reference points get that point's features copied into the main
+    distance/travel columns. A `reference_location` column records the key
+    used (empty for rows that keep the main reference point).
+    """
+    codes, names = pd.factorize(choice)
+    # Missing values have code -1, which picks the trailing ""
+    keys = np.array([reference_key(str(v)) for v in names] + [""], dtype=object)[codes]
+    masks = {key: keys == key for key in reference_keys}
+    masks = {key: mask for key, mask in masks.items() if mask.any()}
+
+    for name in REFERENCE_FEATURES:
+        name = name.replace("travel_category_code", "travel_category")
+        col = results_df[name]
+        categorical = isinstance(col.dtype, pd.CategoricalDtype)
+        values = col.to_numpy(dtype=object) if categorical else col.to_numpy(copy=True)
+        for key, mask in masks.items():
+            values[mask] = results_df[reference_feature_name(name, key)].to_numpy(dtype=values.dtype)[mask]
+        results_df[name] = pd.Categorical(values) if categorical else values
+
+    chosen = np.full(len(results_df), "", dtype=object)
+    for key, mask in masks.items():
+        chosen[mask] = key
+    results_df.insert(results_df.columns.get_loc("distance_from_ref_km"), "reference_location", chosen)
+
+
 def extract_location_features_dataframe(
     df: pd.DataFrame,
     extractor: LocationExtractor,
@@ -135,10 +409,47 @@ def extract_location_features_dataframe(
     text_columns: List[str],
     verbose: bool = True,
     allow_online_fallback: bool = False,
+    engine: Optional[ParallelExtractionEngine] = None,
+    dedup: bool = True,
+    run_stats: Optional[Dict] = None,
+    row_offset: int = 0,
+    config_fp: Optional[str] = None,
+    prior: Optional[PriorResults] = None,
+    batch_size: int = 256,
+    reference_column: Optional[str] = None,
+    stages: Optional[StageStore] = None,
 ) -> pd.DataFrame:
     """
     Extract location features from a dataframe and return comprehensive results.
 
+    With `dedup` (default), rows are collapsed to unique combined texts; the
+    ensemble and LocationExtractor run once per unique text and the results are
+    fanned back out to every row. Row counts, unique texts, dedup ratio and the
+    estimated time saved are written into `run_stats` if a dict is passed.
+    `row_offset` is added to row_index when `df` is one chunk of a larger file.
+
+    If `engine` is given, ensemble extraction runs in its worker processes and
+    only geocoding/feature calculation runs here, so all lookups still go
+    through the extractor's single LocationCache. Rows come back in order and
+    match the serial output.
+
+    If `reference_column` names an input column, it is copied to the output
+    and each row's main distance/travel features use the reference point it
+    names (see select_row_references).
+
+    Texts are extracted and resolved `batch_size` at a time through the batch
+    APIs (extract_records_batch / extract_location_features_batch), which
+    give the same results as the per-row methods.
+
+    If `config_fp` is given, each row gets a `row_fingerprint` of its combined
+    text under that config. Texts whose fingerprint is found in `prior` reuse
+    the stored features and skip extraction and geocoding entirely.
+
+    With `stages`, the combined text, candidates, resolutions and features of
+    this chunk are stored under keys of the settings that produced them, and
+    whichever stages are already stored for the current settings are loaded
+    instead of recomputed (see location_extraction.stages).
+
     Returns a dataframe with:
     - All original text columns
     - Combined text column
@@ -146,83 +457,193 @@ def extract_location_features_dataframe(
     - Geocoded coordinates
     - Distance/travel features
     - Validation results
+    Feature columns use compact dtypes (float32, int8, categorical strings);
+    see location_extraction.feature_columns.
     """
-    combined_text = combine_text_columns(df, text_columns)
-    results = []
+    # Stage parts are identified by the chunk's first row
+    part = row_offset
+    stages_loaded: List[str] = []
+    combined_text = None
+    if stages is not None:
+        stored = stages.load("text", part)
+        if stored is not None and len(stored) == len(df):
+            combined_text = pd.Series(stored["combined_text"].to_numpy(dtype=object), index=df.index)
+            stages_loaded.append("text")
+    if combined_text is None:
+        combined_text = combine_text_columns(df, text_columns)
+        if stages is not None:
+            stages.save("text", part, pd.DataFrame({"combined_text": combined_text.to_numpy()}))
     total = len(combined_text)
 
+    # Collapse rows to unique combined texts; `codes` maps each row back to
+    # its unique text so results can be fanned out after extraction
+    if dedup:
+        codes, unique_texts = pd.factorize(combined_text, sort=False)
+        unique_texts = list(unique_texts)
+    else:
+        codes = np.arange(total)
+        unique_texts = combined_text.tolist()
+    n_unique = len(unique_texts)
+
     if verbose:
         print(f"Processing {total} rows...")
-        print(f"Ensemble strategy status: {ensemble_strategy.get_strategy_status()}")
+        if dedup:
+            print(f"Unique texts: {n_unique} ({100 * (1 - n_unique / max(total, 1)):.1f}% duplicates collapsed)")
+        if prior is not None:
+            print(f"Prior results available for {len(prior)} fingerprints")
+        if engine is not None:
+            print(f"Extracting with {engine.workers} worker processes")
+        else:
+            print(f"Ensemble strategy status: {ensemble_strategy.get_strategy_status()}")
 
     start_time = time.time()
     found_count = 0
-
-    for i, text in enumerate(combined_text):
-        # Get ensemble extraction with confidence
-        ensemble_results = ensemble_strategy.extract_with_confidence(text)
-
-        # Get full location features from extractor (includes geocoding)
-        features = extractor.extract_location_features(
-            text,
-            allow_online_fallback=allow_online_fallback
-        )
-
-        # Build result row
-        result = {
-            "row_index": i,
-            "combined_text": text,
-        }
-
-        # Add original text columns
-        for col in text_columns:
-            if col in df.columns:
-                result[col] = df.iloc[i][col]
-
-        # Add ensemble-specific fields
-        if ensemble_results:
-            best = ensemble_results[0]
-            result["ensemble_location"] = best["location"]
-            result["ensemble_confidence"] = best["confidence"]
-            result["ensemble_sources"] = ", ".join(best["sources"])
-            result["ensemble_in_database"] = best["in_database"]
-            result["ensemble_all_locations"] = ", ".join([e["location"] for e in ensemble_results])
-            result["ensemble_num_locations"] = len(ensemble_results)
+    # Results go straight into typed columns, one row per unique text
+    feature_columns = FeatureColumns(n_unique, feature_schema(extractor.reference_keys))
+
+    # Reuse features stored under the same fingerprint in prior outputs
+    fingerprints = [text_fingerprint(text, config_fp) for text in unique_texts] if config_fp else None
+    todo = list(range(n_unique))
+    if prior is not None and fingerprints is not None:
+        todo = []
+        for i, fp in enumerate(fingerprints):
+            stored = prior.get(fp)
+            if stored is None:
+                todo.append(i)
+            else:
+                feature_columns.set_row(i, stored)
+    todo_texts = [unique_texts[i] for i in todo]
+    n_todo = len(todo)
+
+    # Stored stages for exactly these texts: finished features are used as
+    # they are; stored candidates/resolutions skip extraction/geocoding
+    stored_features = stored_candidates = stored_resolution = None
+    if stages is not None and n_todo:
+        stored_features = stages.load("features", part, todo_texts)
+        if stored_features is None:
+            stored_candidates = stages.load("candidates", part, todo_texts)
+            if stored_candidates is not None:
+                stages_loaded.append("candidates")
+                stored = stages.load("resolved", part, todo_texts)
+                if stored is not None:
+                    stored_resolution = resolution_from_frame(stored)
+                    stages_loaded.append("resolved")
         else:
-            result["ensemble_location"] = None
-            result["ensemble_confidence"] = 0.0
-            result["ensemble_sources"] = ""
-            result["ensemble_in_database"] = False
-            result["ensemble_all_locations"] = ""
-            result["ensemble_num_locations"] = 0
-
-        # Add all features from LocationExtractor
-        result.update(features)
-
-        results.append(result)
-
-        if features.get("locations_found", 0) > 0:
-            found_count += 1
+            stages_loaded.extend(["candidates", "resolved", "features"])
+
+    if stored_features is not None:
+        feature_columns.set_columns(todo, {c: stored_features[c].to_numpy() for c in stored_features.columns})
+        found_count = int((stored_features["locations_found"] > 0).sum())
+        n_todo_batches = 0
+    else:
+        n_todo_batches = n_todo
+    new_candidates: Dict[str, List] = {}
+    new_resolution: Dict[str, List] = {}
+
+    # Work through the texts in batches: one extraction pass per batch gives
+    # each text's confidence detail plus the candidate list the extractor
+    # geocodes, then the batch is resolved and written column-wise
+    row_extractions = None
+    if engine is not None and stored_candidates is None and n_todo_batches:
+        row_extractions = engine.imap(todo_texts)
+    for start in range(0, n_todo_batches, batch_size):
+        rows = todo[start:start + batch_size]
+        batch = todo_texts[start:start + batch_size]
+        if stored_candidates is not None:
+            stored = stored_candidates.iloc[start:start + batch_size]
+            candidates = [list(c) for c in stored["candidates"]]
+            feature_columns.set_columns(rows, {
+                c: stored[c].to_numpy() for c in stored.columns if c != "candidates"})
+        else:
+            if row_extractions is not None:
+                extractions = list(itertools.islice(row_extractions, len(batch)))
+            else:
+                extractions = ensemble_strategy.extract_records_batch(batch)
+            candidates = [locations for _, locations in extractions]
+            # Ensemble-specific fields, rendered from the compact records
+            fields = ensemble_columns([records for records, _ in extractions])
+            feature_columns.set_columns(rows, fields)
+            for name, values in dict(fields, candidates=candidates).items():
+                new_candidates.setdefault(name, []).extend(values)
+
+        # Geocoding/validity filtering, then all features from LocationExtractor
+        if stored_resolution is not None:
+            resolution = {k: v[start:start + batch_size] for k, v in stored_resolution.items()}
+        else:
+            resolution = extractor.resolve_batch(
+                batch,
+                allow_online_fallback=allow_online_fallback,
+                locations=candidates,
+            )
+            for k, v in resolution.items():
+                new_resolution.setdefault(k, []).extend(v)
+        features = extractor.features_from_resolution(resolution)
+        feature_columns.set_columns(rows, features)
+        found_count += int((features["locations_found"] > 0).sum())
 
         # Progress reporting
-        if verbose and (i + 1) % 100 == 0:
+        if verbose:
+            done = start + len(batch)
             elapsed = time.time() - start_time
-            rate = (i + 1) / elapsed
-            remaining = (total - i - 1) / rate if rate > 0 else 0
-            pct_found = 100 * found_count / (i + 1)
-            print(f"  Processed {i + 1}/{total} ({100 * (i + 1) / total:.1f}%) "
+            rate = done / max(elapsed, 1e-9)
+            remaining = (n_todo - done) / rate if rate > 0 else 0
+            pct_found = 100 * found_count / done
+            print(f"  Processed {done}/{n_todo} unique texts ({100 * done / n_todo:.1f}%) "
                   f"- Found: {pct_found:.1f}% - ETA: {remaining:.0f}s")
 
+    if stages is not None and stored_features is None and n_todo:
+        if new_candidates:
+            stages.save("candidates", part, pd.DataFrame(new_candidates), todo_texts)
+        if new_resolution:
+            stages.save("resolved", part, resolution_to_frame(new_resolution), todo_texts)
+        stages.save("features", part, feature_columns.to_frame(todo), todo_texts)
+
     elapsed = time.time() - start_time
+
+    # Fan unique results back out to every row, after the row/text columns
+    results_df = pd.DataFrame({
+        "row_index": np.arange(row_offset, row_offset + total),
+        "combined_text": combined_text.to_numpy(),
+    })
+    if fingerprints is not None:
+        results_df["row_fingerprint"] = np.asarray(fingerprints, dtype=object)[codes]
+    for col in text_columns + ([reference_column] if reference_column else []):
+        if col in df.columns:
+            results_df[col] = df[col].to_numpy()
+    results_df = pd.concat([results_df, feature_columns.to_frame(codes)], axis=1)
+    if reference_column and reference_column in df.columns:
+        select_row_references(results_df, df[reference_column], extractor.reference_keys)
+
+    # Time saved (by dedup and reuse) is estimated from the mean cost of each
+    # extracted text
+    per_text = elapsed / n_todo if n_todo else 0.0
+    dedup_stats = {
+        "total_rows": total,
+        "unique_texts": n_unique,
+        "reused_texts": n_unique - n_todo,
+        "dedup_ratio": 1 - n_unique / total if total else 0.0,
+        "extraction_seconds": elapsed,
+        "est_seconds_saved": (total - n_todo) * per_text,
+        "stages_loaded": stages_loaded,
+    }
+    if run_stats is not None:
+        run_stats.update(dedup_stats)
+
     if verbose:
-        print(f"\nCompleted in {elapsed:.1f}s ({total / elapsed:.1f} rows/sec)")
-        print(f"Locations found: {found_count}/{total} ({100 * found_count / total:.1f}%)")
+        found_rows = int(results_df["locations_found"].gt(0).sum()) if total else 0
+        print(f"\nCompleted in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.1f} rows/sec)")
+        print(f"Locations found: {found_rows}/{total} ({100 * found_rows / max(total, 1):.1f}%)")
+
+    return results_df
 
-    return pd.DataFrame(results)
 
+def run_demo(budget_ms: Optional[float] = None):
+    """
+    Run a demo with sample data.
 
-def run_demo():
-    """Run a demo with sample data."""
+    With `budget_ms`, each text is extracted with extract_budgeted() under that
+    per-text latency budget, and the tiers it skipped are shown.
+    """
     print("=" * 70)
     print("LOCATION EXTRACTION DEMO - ENSEMBLE + FULL FEATURES")
     print("=" * 70)
@@ -270,11 +691,19 @@ def run_demo():
     print("-" * 70)
 
     for text in sample_texts:
-        # Ensemble results
-        ensemble_results = ensemble_strategy.extract_with_confidence(text)
+        skipped = None
+        if budget_ms is not None:
+            # Cheapest tiers first, stopping when the budget runs out
+            budgeted = ensemble_strategy.extract_budgeted(text, budget_ms)
+            ensemble_results = budgeted["results"]
+            locations = [r["location"] for r in ensemble_results]
+            skipped = budgeted["tiers_skipped"]
+        else:
+            # Ensemble results and candidates from a single extraction pass
+            ensemble_results, locations = ensemble_strategy.extract_detailed(text)
 
         # Full features
-        features = extractor.extract_location_features(text)
+        features = extractor.extract_location_features(text, locations=locations)
 
         print(f"\nText: {text}")
 
@@ -284,6 +713,8 @@ def run_demo():
                   f"sources: {', '.join(best['sources'])})")
         else:
             print(f"  Ensemble → No location found")
+        if skipped:
+            print(f"  Skipped  → {', '.join(skipped)} (budget {budget_ms:g} ms)")
 
         if features.get("locations_found", 0) > 0:
             print(f"  Features → Primary: {features.get('primary_location', 'N/A')}")
@@ -302,8 +733,13 @@ def run_demo():
           f"({100 * found / len(sample_texts):.1f}%)")
 
 
-def run_benchmark():
-    """Run benchmark comparing strategies."""
+def run_benchmark(tier_threads: int = 0):
+    """
+    Run benchmark comparing strategies.
+
+    With `tier_threads` > 1, also compare per-row latency of the full
+    ensemble with serial and with concurrent tier execution.
+    """
     print("=" * 70)
     print("STRATEGY BENCHMARK")
     print("=" * 70)
@@ -321,21 +757,26 @@ def run_benchmark():
         "International travel to Singapore",
     ] * 10  # 100 texts total
 
+    # Ensembles are built without a memo (and without a result store), so
+    # the repeated texts are timed through the tiers every time
     strategies = [
         ("Ensemble (Full)", EnsembleExtractionStrategy(
             locations_db=AUSTRALIAN_LOCATIONS,
             enable_aho_corasick=True, enable_regex=True,
             enable_spacy=True, enable_phonetic=True,
+            memo_size=0,
         )),
         ("Ensemble (Fast)", EnsembleExtractionStrategy(
             locations_db=AUSTRALIAN_LOCATIONS,
             enable_aho_corasick=True, enable_regex=True,
             enable_spacy=False, enable_phonetic=False,
+            memo_size=0,
         )),
         ("Ensemble (Spacy+Phonetic)", EnsembleExtractionStrategy(
             locations_db=AUSTRALIAN_LOCATIONS,
             enable_aho_corasick=False, enable_regex=False,
             enable_spacy=True, enable_phonetic=True,
+            memo_size=0,
         )),
         ("Aho-Corasick Only", AhoCorasickStrategy(locations_db=AUSTRALIAN_LOCATIONS)),
         ("Regex Only", GazetteerRegexStrategy(locations_db=AUSTRALIAN_LOCATIONS)),
@@ -362,6 +803,43 @@ def run_benchmark():
     print("=" * 70)
     df = pd.DataFrame(results)
     print(df.to_string(index=False))
+    if tier_threads > 1:
+        run_tier_thread_benchmark(test_texts, tier_threads)
+    return df
+
+
+def run_tier_thread_benchmark(texts: List[str], tier_threads: int) -> pd.DataFrame:
+    """Per-row extract_with_confidence() latency, serial vs `tier_threads` concurrent tiers."""
+    print("\n" + "=" * 70)
+    print(f"TIER EXECUTION: SERIAL VS {tier_threads} THREADS")
+    print("=" * 70)
+
+    rows = []
+    outputs = []
+    for name, threads in (("Serial", 0), (f"{tier_threads} threads", tier_threads)):
+        strategy = EnsembleExtractionStrategy(
+            locations_db=AUSTRALIAN_LOCATIONS, enable_tfidf=True, tier_threads=threads, memo_size=0,
+        )
+        strategy.extract_with_confidence(texts[0])  # load every tier before timing
+        latencies = []
+        output = []
+        for text in texts:
+            start = time.perf_counter()
+            output.append(strategy.extract_with_confidence(text))
+            latencies.append(1000.0 * (time.perf_counter() - start))
+        outputs.append(output)
+        rows.append({
+            "Mode": name,
+            "Mean ms/row": round(float(np.mean(latencies)), 3),
+            "p50 ms": round(float(np.percentile(latencies, 50)), 3),
+            "p95 ms": round(float(np.percentile(latencies, 95)), 3),
+        })
+
+    df = pd.DataFrame(rows)
+    print(df.to_string(index=False))
+    serial, threaded = rows[0]["Mean ms/row"], rows[1]["Mean ms/row"]
+    print(f"Per-row latency change: {100 * (threaded - serial) / max(serial, 1e-9):+.1f}% "
+          f"(identical results: {outputs[0] == outputs[1]})")
     return df
 
 
@@ -371,23 +849,94 @@ def process_file(
     text_columns: List[str],
     config: Dict,
     verbose: bool = True,
+    resume: bool = False,
 ):
-    """Process an Excel file and output location features."""
+    """
+    Process an Excel/CSV/Parquet file and output location features.
 
-    # Load input data
-    if verbose:
-        print(f"Loading data from {input_file}...")
+    The input is streamed in chunks of `chunk_size` rows containing only the
+    configured text columns; each chunk is extracted as soon as it is read and
+    handed to an output sink chosen by `output_file`'s extension (.xlsx, .csv,
+    .jsonl or .parquet), so only one chunk of results is held in memory.
+
+    With checkpointing enabled (default), every `checkpoint_every` chunks the
+    finished results and the location cache are persisted under
+    `<output_file>.checkpoint`. With `resume=True`, a matching checkpoint is
+    replayed into the output and processing continues after its last row.
+
+    Every output row carries a `row_fingerprint`; rows whose fingerprint
+    appears in one of the `reuse_from` output files copy those features
+    instead of being extracted again.
 
-    df = pd.read_excel(input_file)
-    print(f"Loaded {len(df)} rows, {len(df.columns)} columns")
+    With `stage_dir` set, each chunk's combined text, candidates, resolutions
+    and features are stored there, keyed by the settings that produced them;
+    a re-run after e.g. a reference location change recomputes only the
+    features.
+
+    Ensemble results are kept across runs in an extraction store (see
+    extraction_store_path), so texts seen before skip extraction entirely.
+
+    Tier stats are accumulated across runs (see tier_stats_path); with
+    `adaptive_tiers`, tiers that found too few unique locations per ms in
+    earlier runs are skipped in this one; they still run, results discarded,
+    on a sample of texts, so their stats keep updating.
+
+    Returns the run summary (row counts, travel categories, dedup stats and
+    the ensemble's per-tier stats, which are also printed).
+    """
+
+    # Tier stats from earlier runs, and the adaptive plan drawn from them
+    stats_path = tier_stats_path(config)
+    persisted_stats = TierStats.load(stats_path) if stats_path else TierStats()
+    tier_plan = None
+    if config.get("adaptive_tiers"):
+        tier_plan = plan_tiers(
+            persisted_stats.summary(),
+            config.get("adaptive_min_yield_per_ms", 0.01),
+            min_calls=config.get("adaptive_min_calls", 200),
+        )
+        config = dict(config, skip_tiers=[d["tier"] for d in tier_plan if d["action"] == "skip"])
+        if verbose:
+            print_tier_plan(tier_plan)
+
+    # Checkpoint of finished row ranges (keyed by input file + settings)
+    checkpoint = None
+    if config.get("enable_checkpoint", True):
+        checkpoint = RunCheckpoint(
+            config.get("checkpoint_dir") or f"{output_file}.checkpoint",
+            RunCheckpoint.make_run_key(input_file, text_columns, _checkpoint_settings(config)),
+        )
+        if resume and checkpoint.load():
+            if verbose:
+                print(f"Resuming from checkpoint: {checkpoint.rows_done} rows already processed")
+        else:
+            if resume and verbose:
+                print("No matching checkpoint found, starting from the first row")
+            checkpoint.reset()
+
+    # Open input data (only the configured text columns, plus the optional
+    # per-row reference column, are read)
+    if verbose:
+        print(f"Streaming data from {input_file}...")
+
+    reference_column = config.get("reference_column")
+    reader = ChunkedTableReader(
+        input_file,
+        text_columns + ([reference_column] if reference_column else []),
+        chunk_size=config.get("chunk_size", 10000),
+        start_row=checkpoint.rows_done if checkpoint is not None else 0,
+    )
 
     # Show available columns
-    available_text_cols = [c for c in text_columns if c in df.columns]
+    available_text_cols = [c for c in reader.available_columns if c in text_columns]
     if verbose:
         print(f"Text columns found: {available_text_cols}")
-        missing = [c for c in text_columns if c not in df.columns]
+        missing = [c for c in reader.missing_columns if c in text_columns]
         if missing:
             print(f"Text columns missing: {missing}")
+        if reference_column:
+            found = reference_column in reader.available_columns
+            print(f"Reference column: {reference_column} ({'found' if found else 'missing'})")
 
     if not available_text_cols:
         raise ValueError(f"No text columns found in {input_file}")
@@ -403,31 +952,113 @@ def process_file(
                   f"{stats['resolved']} resolved, {stats['overrides']} overrides")
 
     # Create ensemble strategy
-    ensemble_strategy = EnsembleExtractionStrategy(
-        locations_db=AUSTRALIAN_LOCATIONS,
-        enable_aho_corasick=config.get("enable_aho_corasick", True),
-        enable_regex=config.get("enable_regex", True),
-        enable_spacy=config.get("enable_spacy", True),
-        enable_phonetic=config.get("enable_phonetic", True),
-        enable_tfidf=config.get("enable_tfidf", False),
-        enable_bow=config.get("enable_bow", False),
-    )
+    ensemble_strategy = EnsembleExtractionStrategy(**ensemble_kwargs_from_config(config))
+    if tier_plan is not None:
+        ensemble_strategy.apply_tier_plan(tier_plan)
 
     if verbose:
         print(f"Ensemble strategy: {ensemble_strategy.get_strategy_status()}")
 
-    # Create extractor
-    extractor = create_ensemble_extractor(config, location_cache)
-
-    # Extract features
-    results_df = extract_location_features_dataframe(
-        df=df,
-        extractor=extractor,
-        ensemble_strategy=ensemble_strategy,
-        text_columns=available_text_cols,
-        verbose=verbose,
-        allow_online_fallback=config.get("enable_online_geocoding", False),
-    )
+    # Create extractor (sharing the ensemble, so models are loaded once)
+    extractor = create_ensemble_extractor(config, location_cache, ensemble_strategy)
+
+    # Fingerprint rows under the current config; load reusable prior results
+    config_fp = feature_config_fingerprint(ensemble_strategy, config)
+    prior = None
+    if config.get("reuse_from"):
+        prior = PriorResults(config["reuse_from"], available_text_cols + ([reference_column] if reference_column else []))
+        if verbose:
+            print(f"Prior results: {len(prior)} fingerprints from {len(config['reuse_from'])} file(s)")
+
+    # Persisted stages, keyed per stage by the settings that produce it
+    stages = None
+    if config.get("stage_dir"):
+        allow_online_fallback = config.get("enable_online_geocoding", False)
+        stages = StageStore(config["stage_dir"], make_stage_keys(
+            RunCheckpoint.make_run_key(input_file, text_columns, {}),
+            {
+                "candidates": ensemble_strategy.config_signature(),
+                "resolved": dict(extractor.resolution_signature(), allow_online_fallback=allow_online_fallback),
+                "features": extractor.feature_signature(),
+            },
+        ))
+        if verbose:
+            print(f"Stages: {config['stage_dir']}")
+
+    # Extract features (fanned out to worker processes when workers > 1)
+    workers = int(config.get("workers", 1) or 1)
+    run_stats: Dict = {}
+    engine = None
+    if workers > 1:
+        engine = ParallelExtractionEngine(
+            ensemble_kwargs_from_config(config),
+            workers=workers,
+            chunk_size=config.get("worker_chunk_size", 256),
+        )
+    # Results are streamed to the output sink chunk by chunk; only running
+    # totals are kept for the summary
+    summary = {"total_rows": 0, "found": 0, "validated": 0, "categories": {}}
+    sink = open_sink(output_file, string_columns=available_text_cols + ([reference_column] if reference_column else []))
+    checkpoint_every = max(1, int(config.get("checkpoint_every", 1)))
+    pending_parts = []
+    start_time = time.time()
+    try:
+        # Replay checkpointed rows into the fresh output before continuing
+        if checkpoint is not None:
+            for part_df, part_stats in checkpoint.iter_parts():
+                sink.write(part_df)
+                _accumulate_run_stats(run_stats, part_stats)
+                _accumulate_summary(summary, part_df)
+        resumed_rows = summary["total_rows"]
+        start_time = time.time()
+
+        for chunk_no, chunk in enumerate(reader, start=1):
+            chunk_stats: Dict = {}
+            chunk_df = extract_location_features_dataframe(
+                df=chunk,
+                extractor=extractor,
+                ensemble_strategy=ensemble_strategy,
+                text_columns=available_text_cols,
+                verbose=False,
+                allow_online_fallback=config.get("enable_online_geocoding", False),
+                engine=engine,
+                dedup=config.get("dedup", True),
+                run_stats=chunk_stats,
+                row_offset=summary["total_rows"],
+                config_fp=config_fp,
+                prior=prior,
+                reference_column=reference_column,
+                stages=stages,
+            )
+            sink.write(chunk_df)
+            _accumulate_run_stats(run_stats, chunk_stats)
+            found = _accumulate_summary(summary, chunk_df)
+
+            if checkpoint is not None:
+                pending_parts.append((chunk_df, chunk_stats))
+                if len(pending_parts) >= checkpoint_every:
+                    _write_checkpoint(checkpoint, pending_parts, location_cache)
+                    pending_parts = []
+
+            if verbose:
+                elapsed = time.time() - start_time
+                rows_done = summary["total_rows"]
+                rate = (rows_done - resumed_rows) / max(elapsed, 1e-9)
+                loaded = chunk_stats.get("stages_loaded")
+                print(f"  Chunk {chunk_no}: {len(chunk_df)} rows "
+                      f"({chunk_stats.get('unique_texts', 0)} unique), found {found} "
+                      f"- {rows_done} rows in {elapsed:.1f}s ({rate:.1f} rows/sec)"
+                      + (f" - stored stages: {', '.join(loaded)}" if loaded else ""))
+    finally:
+        if engine is not None:
+            # Extraction ran in the workers; their tier stats join the local ones
+            ensemble_strategy.tier_stats.merge(engine.tier_stats.snapshot())
+            engine.close()
+        sink.close()
+
+    total = summary["total_rows"]
+    if not total:
+        raise ValueError(f"No data rows found in {input_file}")
 
     # Save cache
     if location_cache is not None:
@@ -437,32 +1068,73 @@ def process_file(
             print(f"Cache updated: {stats['total_entries']} entries, "
                   f"{stats['total_lookups']} total lookups")
 
-    # Ensure output directory exists
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    store_stats = ensemble_strategy.get_store_stats()
+    if store_stats is not None:
+        ensemble_strategy.close_store()
+        if verbose:
+            # Worker processes keep their own hit counts
+            hits = f", {store_stats['hits']} texts reused this run" if workers == 1 else ""
+            print(f"Extraction store: {store_stats['entries']} entries{hits}")
 
-    # Save results
-    results_df.to_excel(output_file, index=False)
+    # The run finished and the output is complete; the checkpoint is no longer needed
+    if checkpoint is not None:
+        checkpoint.clear()
 
     # Print summary
-    found = results_df["locations_found"].gt(0).sum()
-    validated = results_df["is_valid_location"].sum() if "is_valid_location" in results_df.columns else 0
+    found = summary["found"]
+    validated = summary["validated"]
 
     print("\n" + "=" * 70)
     print("EXTRACTION SUMMARY")
     print("=" * 70)
-    print(f"Total rows:          {len(results_df)}")
-    print(f"Locations found:     {found} ({100 * found / len(results_df):.1f}%)")
-    print(f"Validated locations: {validated} ({100 * validated / len(results_df):.1f}%)")
+    print(f"Total rows:          {total}")
+    print(f"Locations found:     {found} ({100 * found / total:.1f}%)")
+    print(f"Validated locations: {validated} ({100 * validated / total:.1f}%)")
+    if config.get("dedup", True) and run_stats:
+        print(f"Unique texts:        {run_stats['unique_texts']} "
+              f"(dedup ratio {100 * run_stats['dedup_ratio']:.1f}%)")
+        print(f"Est. time saved:     {run_stats['est_seconds_saved']:.1f}s "
+              f"(extraction took {run_stats['extraction_seconds']:.1f}s)")
+    if prior is not None and run_stats:
+        print(f"Reused texts:        {run_stats['reused_texts']} (from prior outputs)")
+    if stages is not None:
+        loaded = run_stats.get("stages_loaded", {})
+        print("Stored stages used:  " + (", ".join(
+            f"{stage} ({loaded[stage]} chunk(s))" for stage in STAGES if stage in loaded) or "none"))
     print(f"Output saved to:     {output_file}")
 
     # Show travel category breakdown
-    if "travel_category" in results_df.columns:
+    if summary["categories"]:
         print("\nTravel Category Breakdown:")
-        category_counts = results_df["travel_category"].value_counts()
-        for cat, count in category_counts.items():
-            print(f"  {cat}: {count} ({100 * count / len(results_df):.1f}%)")
-
-    return results_df
+        categories = sorted(summary["categories"].items(), key=lambda kv: -kv[1])
+        for cat, count in categories:
+            print(f"  {cat}: {count} ({100 * count / total:.1f}%)")
+
+    tier_stats = ensemble_strategy.get_tier_stats()
+    if tier_stats and verbose:
+        print_tier_stats(tier_stats)
+    if stats_path:
+        persisted_stats.merge(ensemble_strategy.tier_stats.snapshot())
+        persisted_stats.save(stats_path)
+
+    summary.update(run_stats)
+    summary["tier_stats"] = tier_stats
+    if tier_plan is not None:
+        summary["tier_plan"] = tier_plan
+    return summary
+
+
+def parse_reference_arg(value: str):
+    """Parse a --reference NAME=LAT,LON[,STATE] argument into (name, point)."""
+    try:
+        name, coords = value.split("=", 1)
+        parts = [p.strip() for p in coords.split(",")]
+        point = {"lat": float(parts[0]), "lon": float(parts[1])}
+        if len(parts) > 2 and parts[2]:
+            point["state"] = parts[2].upper()
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"Invalid --reference '{value}', expected NAME=LAT,LON[,STATE]")
+    return name.strip(), point
 
 
 def main():
@@ -476,16 +1148,19 @@ Examples:
   python main.py -i data.xlsx -o out.xlsx  Process file
   python main.py --no-spacy                Disable spaCy (faster)
   python main.py --enable-tfidf            Enable TF-IDF (expensive)
+  python main.py --workers 8               Extract with 8 worker processes
         """
     )
 
     # Mode selection
     parser.add_argument("--demo", action="store_true", help="Run demo with sample data")
     parser.add_argument("--benchmark", action="store_true", help="Run strategy benchmark")
+    parser.add_argument("--budget-ms", type=float,
+                        help="With --demo: per-text latency budget for ensemble extraction")
 
     # File options
-    parser.add_argument("-i", "--input", type=str, help="Input Excel file")
-    parser.add_argument("-o", "--output", type=str, help="Output Excel file")
+    parser.add_argument("-i", "--input", type=str, help="Input file (.xlsx, .csv or .parquet)")
+    parser.add_argument("-o", "--output", type=str, help="Output file (.xlsx, .csv, .jsonl or .parquet)")
     parser.add_argument("--columns", type=str, help="Comma-separated text columns")
 
     # Strategy options
@@ -497,6 +1172,42 @@ Examples:
     # Cache options
     parser.add_argument("--no-cache", action="store_true", help="Disable location caching")
     parser.add_argument("--cache-dir", type=str, default="data", help="Cache directory")
+    parser.add_argument("--no-extraction-store", action="store_true",
+                        help="Do not keep/reuse ensemble results across runs")
+
+    # Performance options
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for extraction (default: 1, serial)")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="Extract every row, even when its combined text repeats")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Rows per streamed input chunk (default: 10000)")
+    parser.add_argument("--tier-threads", type=int,
+                        help="Run independent ensemble tiers on this many threads (with --benchmark: "
+                             "compare against serial)")
+    parser.add_argument("--adaptive-tiers", action="store_true",
+                        help="Skip tiers whose unique hits per ms in earlier runs are below --min-yield-per-ms")
+    parser.add_argument("--min-yield-per-ms", type=float,
+                        help=f"Threshold for --adaptive-tiers (default {DEFAULT_CONFIG['adaptive_min_yield_per_ms']})")
+    parser.add_argument("--tier-stats-file", type=str,
+                        help="Tier stats file kept across runs (default: <cache-dir>/tier_stats.json)")
+
+    # Checkpoint options
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted run from its last checkpoint")
+    parser.add_argument("--no-checkpoint", action="store_true", help="Disable checkpointing")
+    parser.add_argument("--checkpoint-dir", type=str,
+                        help="Checkpoint directory (default: <output>.checkpoint)")
+    parser.add_argument("--reuse-from", type=str, nargs="+",
+                        help="Prior output file(s) whose unchanged rows are reused")
+    parser.add_argument("--stage-dir", type=str,
+                        help="Persist pipeline stages here; re-runs recompute only changed stages")
+
+    # Reference point options
+    parser.add_argument("--reference", type=str, action="append", metavar="NAME=LAT,LON[,STATE]",
+                        help="Extra reference point (repeatable), e.g. melbourne=-37.8136,144.9631,VIC")
+    parser.add_argument("--reference-column", type=str,
+                        help="Input column naming each row's reference point")
 
     # Output options
     parser.add_argument("-q", "--quiet", action="store_true", help="Quiet mode")
@@ -505,12 +1216,12 @@ Examples:
 
     # Demo mode
     if args.demo:
-        run_demo()
+        run_demo(budget_ms=args.budget_ms)
         return
 
     # Benchmark mode
     if args.benchmark:
-        run_benchmark()
+        run_benchmark(tier_threads=args.tier_threads or 0)
         return
 
     # File processing mode
@@ -529,8 +1240,36 @@ Examples:
         config["enable_bow"] = True
     if args.no_cache:
         config["enable_cache"] = False
+    if args.no_extraction_store:
+        config["enable_extraction_store"] = False
     if args.cache_dir:
         config["cache_dir"] = args.cache_dir
+    if args.workers:
+        config["workers"] = args.workers
+    if args.tier_threads:
+        config["tier_threads"] = args.tier_threads
+    if args.no_dedup:
+        config["dedup"] = False
+    if args.chunk_size:
+        config["chunk_size"] = args.chunk_size
+    if args.no_checkpoint:
+        config["enable_checkpoint"] = False
+    if args.checkpoint_dir:
+        config["checkpoint_dir"] = args.checkpoint_dir
+    if args.reuse_from:
+        config["reuse_from"] = args.reuse_from
+    if args.stage_dir:
+        config["stage_dir"] = args.stage_dir
+    if args.adaptive_tiers:
+        config["adaptive_tiers"] = True
+    if args.min_yield_per_ms is not None:
+        config["adaptive_min_yield_per_ms"] = args.min_yield_per_ms
+    if args.tier_stats_file:
+        config["tier_stats_file"] = args.tier_stats_file
+    if args.reference:
+        config["reference_locations"] = dict(parse_reference_arg(r) for r in args.reference)
+    if args.reference_column:
+        config["reference_column"] = args.reference_column
 
     input_file = args.input or config["input_file"]
     output_file = args.output or config["output_file"]
@@ -551,6 +1290,7 @@ Examples:
         text_columns=config["text_columns"],
         config=config,
         verbose=not args.quiet,
+        resume=args.resume,
     )
 
 